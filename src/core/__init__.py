@@ -9,11 +9,10 @@ from .cache_manager import ImprovedCacheManager
 from .config_manager import GalleryConfig
 from .config_manager import load_config as _load_config
 from .config_manager import save_config as _save_config
-from .gallery_generator import generate_html_gallery as _generate_html_gallery
-from .image_processor import get_exif_data as _get_exif_data
-from .image_processor import get_orientation as _get_orientation
-from .image_processor import scan_directories as _scan_directories
 
+# gallery_generator (Jinja2) and image_processor (Pillow) are imported inside the
+# wrappers below so that importing core, which main does at startup via
+# core.cache_manager, does not pay for them before they are needed.
 
 # Re-export with proper type annotations
 def load_config() -> tuple[str, list[str], list[str], bool, int, bool, str]:
@@ -91,6 +90,8 @@ def generate_html_gallery(
     Returns:
         Tuple of (success: bool, skipped_count: int)
     """
+    from .gallery_generator import generate_html_gallery as _generate_html_gallery
+
     return _generate_html_gallery(
         gallery_data, focal_length_data, date_data,
         template_path, output_dir, allowed_root_dirs,
@@ -107,6 +108,8 @@ def get_exif_data(image_path: str) -> ExifData:
     Returns:
         Dictionary containing EXIF data (FocalLength, Orientation, DateTime, etc.)
     """
+    from .image_processor import get_exif_data as _get_exif_data
+
     return _get_exif_data(image_path)
 
 
@@ -120,6 +123,8 @@ def get_orientation(image_path: str, exif_data: ExifData) -> str:
     Returns:
         One of: 'portrait', 'landscape', or 'unknown'
     """
+    from .image_processor import get_orientation as _get_orientation
+
     return _get_orientation(image_path, exif_data)
 
 
@@ -133,6 +138,8 @@ def scan_directories(root_dir: str, exclude_patterns: str = "") -> dict[str, dic
     Returns:
         Dictionary mapping slate names to image lists
     """
+    from .image_processor import scan_directories as _scan_directories
+
     return _scan_directories(root_dir, exclude_patterns)
 
 
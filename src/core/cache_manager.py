@@ -20,6 +20,9 @@ from utils.logging_config import log_function, logger
 # V2 (current): Paths + EXIF + per-file mtime
 CACHE_VERSION = 2
 
+# Compact JSON output: no whitespace after separators keeps cache files smaller
+JSON_SEPARATORS = (",", ":")
+
 # ----------------------------- ImprovedCacheManager Class -----------------------------
 
 
@@ -81,64 +84,121 @@ class ImprovedCacheManager:
         Returns:
             Dictionary of slates without _metadata, or None if cache doesn't exist
         """
+        return self.load_composite_cache_with_metadata(root_dirs)[0]
+
+    @log_function
+    def load_composite_cache_with_metadata(
+        self, root_dirs: list[str]
+    ) -> tuple[Optional[ProcessedResults], Optional[CacheMetadata]]:
+        """Load cache for multiple directories together with its metadata.
+
+        The file is parsed once; pass the metadata to validate_composite_metadata
+        instead of calling validate_composite_cache, which would parse it again.
+
+        Args:
+            root_dirs: List of root directories
+
+        Returns:
+            (slates, metadata); slates is None if the cache doesn't exist or can't be
+            read, metadata is None for old-format caches without it
+        """
         cache_file = self.get_composite_cache_file(root_dirs)
         if os.path.exists(cache_file):
             try:
-                with self._cache_lock, open(cache_file) as f:
-                    cache_data = json.load(f)
-
-                # Strip _metadata from returned slates
-                slates: ProcessedResults = {k: v for k, v in cache_data.items() if k != "_metadata"}
+                slates, metadata = self._split_cache_data(self._read_cache_data(cache_file))
                 logger.info(f"Loaded composite cache for {len(root_dirs)} directories")
-                return slates
+                return slates, metadata
             except Exception as e:
                 logger.error(f"Error loading composite cache: {e}", exc_info=True)
-                return None
+                return None, None
         else:
             logger.info(f"No composite cache found for {len(root_dirs)} directories")
-            return None
+            return None, None
 
     @log_function
-    def save_composite_cache(self, root_dirs: list[str], slates: ProcessedResults) -> None:
+    def save_composite_cache(self, root_dirs: list[str], slates: ProcessedResults) -> Optional[CacheMetadata]:
         """Save cache for multiple directories.
 
         Args:
             root_dirs: List of root directories
             slates: Dictionary of slates to cache
+
+        Returns:
+            The metadata written with the slates, or None if saving failed
         """
         cache_file = self.get_composite_cache_file(root_dirs)
         try:
-            # Count total images across all slates (defensive: handle malformed JSON data)
-            file_count = 0
-            for slate_data in slates.values():
-                if isinstance(slate_data, dict) and "images" in slate_data:  # pyright: ignore[reportUnnecessaryIsInstance]
-                    images = slate_data.get("images", [])
-                    if isinstance(images, list):  # pyright: ignore[reportUnnecessaryIsInstance]
-                        file_count += len(images)
-
-            # Get max modification time across all directories
-            dir_mtimes = [
-                os.path.getmtime(d) for d in root_dirs if os.path.exists(d)
-            ]
+            # Stat directories in worker threads (I/O bound, releases the GIL) so the
+            # syscall latency overlaps with the image count below
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(8, len(root_dirs)))
+            ) as executor:
+                mtime_futures = [executor.submit(self._get_dir_mtime, d) for d in root_dirs]
+
+                # Count total images across all slates (defensive: handle malformed JSON data)
+                file_count = 0
+                for slate_data in slates.values():
+                    if isinstance(slate_data, dict) and "images" in slate_data:  # pyright: ignore[reportUnnecessaryIsInstance]
+                        images = slate_data.get("images", [])
+                        if isinstance(images, list):  # pyright: ignore[reportUnnecessaryIsInstance]
+                            file_count += len(images)
+
+                # Get max modification time across all directories
+                dir_mtimes = [m for m in (f.result() for f in mtime_futures) if m is not None]
             max_mtime = max(dir_mtimes) if dir_mtimes else 0
 
             # Add metadata for cache validation
-            cache_data = {
-                "_metadata": {
-                    "version": CACHE_VERSION,
-                    "scan_time": time.time(),
-                    "file_count": file_count,
-                    "dir_mtime": max_mtime,
-                    "root_dirs": sorted(root_dirs),
-                },
-                **slates,
+            metadata: CacheMetadata = {
+                "version": CACHE_VERSION,
+                "scan_time": time.time(),
+                "file_count": file_count,
+                "dir_mtime": max_mtime,
+                "root_dirs": sorted(root_dirs),
             }
+            cache_data = {"_metadata": metadata, **slates}
 
-            with self._cache_lock, open(cache_file, "w") as f:
-                json.dump(cache_data, f)
+            self._write_cache_data(cache_file, cache_data)
             logger.info(f"Saved V{CACHE_VERSION} composite cache for {len(root_dirs)} directories ({file_count} images)")
+            return metadata
         except Exception as e:
             logger.error(f"Error saving composite cache: {e}", exc_info=True)
+            return None
+
+    def _read_cache_data(self, cache_file: str) -> dict[str, object]:
+        """Read a cache file and parse its JSON.
+
+        The file is read as raw bytes under the cache lock and parsed after the
+        lock is released, skipping the text-mode decoding layer.
+        """
+        with self._cache_lock, open(cache_file, "rb") as f:
+            raw = f.read()
+        return cast(dict[str, object], json.loads(raw))
+
+    @staticmethod
+    def _split_cache_data(cache_data: dict[str, object]) -> tuple[ProcessedResults, Optional[CacheMetadata]]:
+        """Separate a parsed cache file into its slates and its _metadata entry."""
+        metadata_obj = cache_data.get("_metadata")
+        metadata = cast(CacheMetadata, metadata_obj) if isinstance(metadata_obj, dict) else None
+        slates = cast(ProcessedResults, {k: v for k, v in cache_data.items() if k != "_metadata"})
+        return slates, metadata
+
+    def _write_cache_data(self, cache_file: str, cache_data: dict[str, object]) -> None:
+        """Serialize cache data to compact JSON and write it in a single call.
+
+        Encoding the whole document with json.dumps is several times faster than
+        json.dump, which streams many small chunks through the file object.
+        """
+        payload = json.dumps(cache_data, separators=JSON_SEPARATORS).encode("utf-8")
+        with self._cache_lock, open(cache_file, "wb") as f:
+            _ = f.write(payload)
+
+    @staticmethod
+    def _get_dir_mtime(directory: str) -> Optional[float]:
+        """Return the modification time of a directory, or None if it is missing."""
+        try:
+            return os.stat(directory).st_mtime
+        except OSError:
+            return None
 
     @log_function
     def validate_composite_cache(self, root_dirs: list[str]) -> bool:
@@ -155,14 +215,27 @@ class ImprovedCacheManager:
             return False
 
         try:
-            with self._cache_lock, open(cache_file) as f:
-                cache_data: dict[str, object] = cast(dict[str, object], json.load(f))
+            _, metadata = self._split_cache_data(self._read_cache_data(cache_file))
+        except Exception as e:
+            logger.error(f"Error validating composite cache: {e}", exc_info=True)
+            return False
+        return self.validate_composite_metadata(root_dirs, metadata)
 
-            metadata_obj = cache_data.get("_metadata")
-            if not isinstance(metadata_obj, dict):
+    @log_function
+    def validate_composite_metadata(self, root_dirs: list[str], metadata: Optional[CacheMetadata]) -> bool:
+        """Check composite cache metadata against the directories' current state.
+
+        Args:
+            root_dirs: List of root directories
+            metadata: Metadata loaded or saved with the composite cache
+
+        Returns:
+            True if the cached slates are still valid, False if stale or metadata is missing
+        """
+        try:
+            if not isinstance(metadata, dict):
                 logger.info("Composite cache has no metadata (old format)")
                 return False
-            metadata = cast(CacheMetadata, metadata_obj)
 
             # Check if directories match
             cached_dirs_obj = metadata.get("root_dirs")
@@ -208,22 +281,31 @@ class ImprovedCacheManager:
         Returns:
             Dictionary of slates without _metadata, or None if cache doesn't exist
         """
+        return self.load_cache_with_metadata(root_dir)[0]
+
+    @log_function
+    def load_cache_with_metadata(self, root_dir: str) -> tuple[Optional[ProcessedResults], Optional[CacheMetadata]]:
+        """Load a directory's cache together with its metadata.
+
+        The file is parsed once; pass the metadata to validate_metadata instead of
+        calling validate_cache, which would parse it again.
+
+        Returns:
+            (slates, metadata); slates is None if the cache doesn't exist or can't be
+            read, metadata is None for old-format caches without it
+        """
         cache_file = self.get_cache_file(root_dir)
         if os.path.exists(cache_file):
             try:
-                with self._cache_lock, open(cache_file) as f:
-                    cache_data = json.load(f)
-
-                # Strip _metadata from returned slates
-                slates: ProcessedResults = {k: v for k, v in cache_data.items() if k != "_metadata"}
+                slates, metadata = self._split_cache_data(self._read_cache_data(cache_file))
                 logger.info(f"Loaded slates from cache for directory: {root_dir}")
-                return slates
+                return slates, metadata
             except Exception as e:
                 logger.error(f"Error loading cache for {root_dir}: {e}", exc_info=True)
-                return None
+                return None, None
         else:
             logger.info(f"No cache found for directory: {root_dir}")
-            return None
+            return None, None
 
     @log_function
     def validate_cache(self, root_dir: str) -> bool:
@@ -239,14 +321,27 @@ class ImprovedCacheManager:
             return False
 
         try:
-            with self._cache_lock, open(cache_file) as f:
-                cache_data: dict[str, object] = cast(dict[str, object], json.load(f))
+            _, metadata = self._split_cache_data(self._read_cache_data(cache_file))
+        except Exception as e:
+            logger.error(f"Error validating cache for {root_dir}: {e}", exc_info=True)
+            return False
+        return self.validate_metadata(root_dir, metadata)
 
-            metadata_obj = cache_data.get("_metadata")
-            if not isinstance(metadata_obj, dict):
+    @log_function
+    def validate_metadata(self, root_dir: str, metadata: Optional[CacheMetadata]) -> bool:
+        """Check cache metadata against the directory's current state.
+
+        Args:
+            root_dir: Root directory the cache was built from
+            metadata: Metadata loaded or saved with the directory's cache
+
+        Returns:
+            True if the cached slates are still valid, False if stale or metadata is missing
+        """
+        try:
+            if not isinstance(metadata, dict):
                 logger.info(f"Cache for {root_dir} has no metadata (old format)")
                 return False
-            metadata = cast(CacheMetadata, metadata_obj)
 
             # Check directory modification time
             dir_mtime_obj = metadata.get("dir_mtime")
@@ -277,7 +372,12 @@ class ImprovedCacheManager:
             return False
 
     @log_function
-    def save_cache(self, root_dir: str, slates: ProcessedResults) -> None:
+    def save_cache(self, root_dir: str, slates: ProcessedResults) -> Optional[CacheMetadata]:
+        """Save a directory's slates to its cache file.
+
+        Returns:
+            The metadata written with the slates, or None if saving failed
+        """
         cache_file = self.get_cache_file(root_dir)
         try:
             # Count total images across all slates (defensive: handle malformed JSON data)
@@ -292,21 +392,20 @@ class ImprovedCacheManager:
             dir_mtime = os.path.getmtime(root_dir) if os.path.exists(root_dir) else 0
 
             # Add metadata for cache validation
-            cache_data = {
-                "_metadata": {
-                    "version": CACHE_VERSION,
-                    "scan_time": time.time(),
-                    "file_count": file_count,
-                    "dir_mtime": dir_mtime,
-                },
-                **slates,
+            metadata: CacheMetadata = {
+                "version": CACHE_VERSION,
+                "scan_time": time.time(),
+                "file_count": file_count,
+                "dir_mtime": dir_mtime,
             }
+            cache_data = {"_metadata": metadata, **slates}
 
-            with self._cache_lock, open(cache_file, "w") as f:
-                json.dump(cache_data, f)
+            self._write_cache_data(cache_file, cache_data)
             logger.info(f"Saved V{CACHE_VERSION} cache for directory: {root_dir} ({file_count} images)")
+            return metadata
         except Exception as e:
             logger.error(f"Error saving cache for {root_dir}: {e}", exc_info=True)
+            return None
 
     @log_function
     def process_images_batch(
@@ -532,8 +631,7 @@ class ImprovedCacheManager:
             return 0
 
         try:
-            with self._cache_lock, open(cache_file) as f:
-                cache_data: dict[str, object] = cast(dict[str, object], json.load(f))
+            cache_data = self._read_cache_data(cache_file)
 
             metadata_obj = cache_data.get("_metadata")
             if not isinstance(metadata_obj, dict):
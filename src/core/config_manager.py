@@ -3,12 +3,13 @@
 Uses lazy initialization to avoid crashes in read-only environments.
 """
 
-import codecs
-import configparser
+import contextlib
 import json
 import os
+import stat
+import tempfile
 import traceback
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
 from utils.logging_config import ensure_handlers_initialized, log_function, logger
@@ -22,6 +23,7 @@ class GalleryConfig:
     selected_slate_dirs: list[str] = field(default_factory=list)
     generate_thumbnails: bool = False
     thumbnail_size: int = 600
+    high_quality_thumbnails: bool = False
     lazy_loading: bool = True
     exclude_patterns: str = ""
 
@@ -34,6 +36,16 @@ CACHE_DIR = os.path.expanduser("~/.slate_gallery/cache")
 _directories_initialized = False
 _directories_error: Optional[str] = None
 
+# Boolean spellings accepted in the config file (same set configparser accepts)
+_BOOLEAN_STATES = {
+    "1": True, "yes": True, "true": True, "on": True,
+    "0": False, "no": False, "false": False, "off": False,
+}
+
+# Parsed config keyed by (path, mtime_ns, size) of the file it was read from, and
+# whether the file set selected_slate_dirs
+_config_cache: Optional[tuple[tuple[str, int, int], GalleryConfig, bool]] = None
+
 
 def _parse_list_value(value: str) -> list[str]:
     """Parse list value, supporting both JSON and legacy pipe-delimited formats.
@@ -58,6 +70,49 @@ def _parse_list_value(value: str) -> list[str]:
     return [item for item in value.split('|') if item]
 
 
+def _read_settings_section(path: str) -> dict[str, str]:
+    """Read the key/value pairs of the [Settings] section from an INI file.
+
+    The config file only ever holds one flat section of scalar values, so a
+    line splitter is enough; keys are lower-cased like configparser does.
+
+    Args:
+        path: Path to the INI file
+
+    Returns:
+        Mapping of option name to raw string value (empty if no [Settings] section)
+    """
+    with open(path, "rb") as f:
+        data = f.read().decode("utf-8-sig")
+
+    settings: dict[str, str] = {}
+    in_settings = False
+    for raw_line in data.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[":
+            in_settings = line == "[Settings]"
+            continue
+        if in_settings:
+            key, sep, value = line.partition("=")
+            if sep:
+                settings[key.strip().lower()] = value.strip()
+    return settings
+
+
+def _as_bool(value: str) -> bool:
+    """Convert a config string to bool using configparser's accepted spellings.
+
+    Raises:
+        ValueError: If the value is not a recognised boolean
+    """
+    try:
+        return _BOOLEAN_STATES[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
 def _serialize_list_value(items: list[str]) -> str:
     """Serialize list to JSON format for safe storage.
 
@@ -100,82 +155,150 @@ def _ensure_directories() -> bool:
     return _directories_error is None
 
 
+def _copy_config(cfg: GalleryConfig) -> GalleryConfig:
+    """Return a copy of cfg whose list fields can be mutated independently."""
+    return replace(
+        cfg,
+        slate_dirs=list(cfg.slate_dirs),
+        selected_slate_dirs=list(cfg.selected_slate_dirs),
+    )
+
+
+def _default_selected_dirs(cfg: GalleryConfig, has_selected_dirs: bool) -> GalleryConfig:
+    """Default selected_slate_dirs to current_slate_dir for configs that lack it.
+
+    Applied after the cached parse on every load, since it depends on whether
+    current_slate_dir exists right now.
+    """
+    if has_selected_dirs:
+        return cfg
+    # Backwards compatibility: default to current_slate_dir if it exists
+    if cfg.current_slate_dir and os.path.exists(cfg.current_slate_dir):
+        cfg.selected_slate_dirs = [cfg.current_slate_dir]
+        logger.info(f"selected_slate_dirs not found in config, defaulting to [{cfg.current_slate_dir}]")
+    else:
+        logger.info("selected_slate_dirs not found in config, defaulting to empty list.")
+    return cfg
+
+
+def _invalidate_config_cache() -> None:
+    """Drop the cached parsed config so the next load re-reads the file."""
+    global _config_cache
+    _config_cache = None
+
+
 @log_function
 def load_config() -> GalleryConfig:
     """Load configuration from config file.
 
+    The parsed result is cached in memory and reused for as long as the file's
+    mtime and size are unchanged, so repeated calls cost a single stat().
+
     Returns:
         GalleryConfig dataclass with all settings
     """
+    global _config_cache
+
     _ensure_directories()  # Lazy initialization (tolerates failures)
 
-    config = configparser.ConfigParser()
-    result = GalleryConfig()
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with codecs.open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                config.read_file(f)
-            try:
-                result.current_slate_dir = config.get("Settings", "current_slate_dir")
-                logger.info(f"Loaded current_slate_dir from config: {result.current_slate_dir}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                logger.warning("current_slate_dir not found in config.")
-
-            try:
-                slate_dirs_str = config.get("Settings", "slate_dirs")
-                result.slate_dirs = _parse_list_value(slate_dirs_str)
-                logger.info(f"Loaded slate_dirs from config: {result.slate_dirs}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                logger.warning("slate_dirs not found in config.")
-
-            try:
-                selected_slate_dirs_str = config.get("Settings", "selected_slate_dirs")
-                result.selected_slate_dirs = _parse_list_value(selected_slate_dirs_str)
-                logger.info(f"Loaded selected_slate_dirs from config: {result.selected_slate_dirs}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                # Backwards compatibility: default to current_slate_dir if it exists
-                if result.current_slate_dir and os.path.exists(result.current_slate_dir):
-                    result.selected_slate_dirs = [result.current_slate_dir]
-                    logger.info(f"selected_slate_dirs not found in config, defaulting to [{result.current_slate_dir}]")
-                else:
-                    logger.info("selected_slate_dirs not found in config, defaulting to empty list.")
-
-            try:
-                result.generate_thumbnails = config.getboolean("Settings", "generate_thumbnails")
-                logger.info(f"Loaded generate_thumbnails from config: {result.generate_thumbnails}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                logger.info("generate_thumbnails not found in config, defaulting to False.")
-
-            try:
-                size = config.getint("Settings", "thumbnail_size")
-                # Validate the size is one of the allowed values
-                if size not in [600, 800, 1200]:
-                    logger.warning("Invalid thumbnail_size in config, defaulting to 600.")
-                else:
-                    result.thumbnail_size = size
-                    logger.info(f"Loaded thumbnail_size from config: {result.thumbnail_size}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                logger.info("thumbnail_size not found in config, defaulting to 600.")
-
-            try:
-                result.lazy_loading = config.getboolean("Settings", "lazy_loading")
-                logger.info(f"Loaded lazy_loading from config: {result.lazy_loading}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                logger.info("lazy_loading not found in config, defaulting to True.")
-
-            try:
-                result.exclude_patterns = config.get("Settings", "exclude_patterns")
-                logger.info(f"Loaded exclude_patterns from config: {result.exclude_patterns}")
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                logger.info("exclude_patterns not found in config, defaulting to empty.")
-        except Exception as e:
-            logger.error(f"Error reading config file: {e}")
-            logger.debug(traceback.format_exc())
-            # Return default config on error
-            return GalleryConfig()
-    else:
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
         logger.warning("Config file not found. Using default settings.")
-    return result
+        return GalleryConfig()
+
+    cache_key = (CONFIG_FILE, st.st_mtime_ns, st.st_size)
+    cached = _config_cache
+    if cached is not None and cached[0] == cache_key:
+        logger.debug("Using cached configuration")
+        return _default_selected_dirs(_copy_config(cached[1]), cached[2])
+
+    result = GalleryConfig()
+    has_selected_dirs = False
+    try:
+        settings = _read_settings_section(CONFIG_FILE)
+
+        current_slate_dir = settings.get("current_slate_dir")
+        if current_slate_dir is not None:
+            result.current_slate_dir = current_slate_dir
+            logger.info(f"Loaded current_slate_dir from config: {result.current_slate_dir}")
+        else:
+            logger.warning("current_slate_dir not found in config.")
+
+        slate_dirs_str = settings.get("slate_dirs")
+        if slate_dirs_str is not None:
+            result.slate_dirs = _parse_list_value(slate_dirs_str)
+            logger.info(f"Loaded slate_dirs from config: {result.slate_dirs}")
+        else:
+            logger.warning("slate_dirs not found in config.")
+
+        selected_slate_dirs_str = settings.get("selected_slate_dirs")
+        has_selected_dirs = selected_slate_dirs_str is not None
+        if selected_slate_dirs_str is not None:
+            result.selected_slate_dirs = _parse_list_value(selected_slate_dirs_str)
+            logger.info(f"Loaded selected_slate_dirs from config: {result.selected_slate_dirs}")
+
+        generate_thumbnails_str = settings.get("generate_thumbnails")
+        if generate_thumbnails_str is not None:
+            result.generate_thumbnails = _as_bool(generate_thumbnails_str)
+            logger.info(f"Loaded generate_thumbnails from config: {result.generate_thumbnails}")
+        else:
+            logger.info("generate_thumbnails not found in config, defaulting to False.")
+
+        thumbnail_size_str = settings.get("thumbnail_size")
+        if thumbnail_size_str is not None:
+            size = int(thumbnail_size_str)
+            # Validate the size is one of the allowed values
+            if size not in [600, 800, 1200]:
+                logger.warning("Invalid thumbnail_size in config, defaulting to 600.")
+            else:
+                result.thumbnail_size = size
+                logger.info(f"Loaded thumbnail_size from config: {result.thumbnail_size}")
+        else:
+            logger.info("thumbnail_size not found in config, defaulting to 600.")
+
+        high_quality_str = settings.get("high_quality_thumbnails")
+        if high_quality_str is not None:
+            result.high_quality_thumbnails = _as_bool(high_quality_str)
+            logger.info(f"Loaded high_quality_thumbnails from config: {result.high_quality_thumbnails}")
+        else:
+            logger.info("high_quality_thumbnails not found in config, defaulting to False.")
+
+        lazy_loading_str = settings.get("lazy_loading")
+        if lazy_loading_str is not None:
+            result.lazy_loading = _as_bool(lazy_loading_str)
+            logger.info(f"Loaded lazy_loading from config: {result.lazy_loading}")
+        else:
+            logger.info("lazy_loading not found in config, defaulting to True.")
+
+        exclude_patterns = settings.get("exclude_patterns")
+        if exclude_patterns is not None:
+            result.exclude_patterns = exclude_patterns
+            logger.info(f"Loaded exclude_patterns from config: {result.exclude_patterns}")
+        else:
+            logger.info("exclude_patterns not found in config, defaulting to empty.")
+    except Exception as e:
+        logger.error(f"Error reading config file: {e}")
+        logger.debug(traceback.format_exc())
+        # Return default config on error
+        return GalleryConfig()
+
+    _config_cache = (cache_key, _copy_config(result), has_selected_dirs)
+    return _default_selected_dirs(result, has_selected_dirs)
+
+
+def replacement_file_mode(path: str) -> int:
+    """Return the permission bits for a temp file that will replace ``path``.
+
+    mkstemp creates 0600 files, so atomic writers apply this before os.replace.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # New file: apply the process umask like open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
 
 
 @log_function
@@ -189,20 +312,45 @@ def save_config(cfg: GalleryConfig) -> None:
         logger.error(f"Cannot save config: {_directories_error}")
         return  # Graceful failure when directories can't be created
 
-    config = configparser.ConfigParser()
-    if not config.has_section("Settings"):
-        config.add_section("Settings")
-    config.set("Settings", "current_slate_dir", cfg.current_slate_dir)
-    config.set("Settings", "slate_dirs", _serialize_list_value(cfg.slate_dirs))
-    config.set("Settings", "selected_slate_dirs", _serialize_list_value(cfg.selected_slate_dirs))
-    config.set("Settings", "generate_thumbnails", str(cfg.generate_thumbnails))
-    config.set("Settings", "thumbnail_size", str(cfg.thumbnail_size))
-    config.set("Settings", "lazy_loading", str(cfg.lazy_loading))
-    config.set("Settings", "exclude_patterns", cfg.exclude_patterns)
+    # The file is one flat section, so build it directly rather than via configparser
+    body = (
+        "[Settings]\n"
+        f"current_slate_dir = {cfg.current_slate_dir}\n"
+        f"slate_dirs = {_serialize_list_value(cfg.slate_dirs)}\n"
+        f"selected_slate_dirs = {_serialize_list_value(cfg.selected_slate_dirs)}\n"
+        f"generate_thumbnails = {cfg.generate_thumbnails}\n"
+        f"thumbnail_size = {cfg.thumbnail_size}\n"
+        f"high_quality_thumbnails = {cfg.high_quality_thumbnails}\n"
+        f"lazy_loading = {cfg.lazy_loading}\n"
+        f"exclude_patterns = {cfg.exclude_patterns}\n"
+        "\n"
+    )
+    tmp_path: Optional[str] = None
     try:
-        with codecs.open(CONFIG_FILE, "w", encoding="utf-8") as configfile:
-            config.write(configfile)
+        # Atomic replace would bypass a read-only config file, so honour it explicitly
+        if os.path.exists(CONFIG_FILE) and not os.access(CONFIG_FILE, os.W_OK):
+            raise PermissionError(f"Permission denied: {CONFIG_FILE}")
+
+        # Replace the symlink's target rather than the link itself
+        target = os.path.realpath(CONFIG_FILE)
+
+        # Write to a unique temp file next to the config, then swap it in so a
+        # crash or concurrent save never leaves a half-written config behind
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".config.", suffix=".tmp", dir=os.path.dirname(target) or None
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(body.encode("utf-8"))
+        # Keep the mode a plain open() would have given
+        os.chmod(tmp_path, replacement_file_mode(target))
+        os.replace(tmp_path, target)
+        tmp_path = None
+        _invalidate_config_cache()
         logger.info(f"Configuration saved: {cfg}")
     except Exception as e:
         logger.error(f"Error saving configuration: {e}")
         logger.debug(traceback.format_exc())
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
@@ -1,14 +1,224 @@
 """Gallery generation - extracted identically from original SlateGallery.py"""
 
+import contextlib
 import os
+import tempfile
+from bisect import bisect_right
 from collections.abc import Callable
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from type_defs import DateData, FocalLengthData, ImageData, SlateData
 from utils.logging_config import log_function, logger
 
+from .config_manager import CACHE_DIR, replacement_file_mode
+
+# Backslash is only a path separator on Windows; on POSIX it is a legal filename
+# character and must be left alone when building file:// URLs
+_BACKSLASH_IS_SEP = os.sep == "\\"
+
+# Write buffer for index.html; gallery pages run to several MB, so the 8 KiB
+# default would turn into hundreds of small write() syscalls
+HTML_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Resolve symlinks when checking images against the allowed roots. Setting
+# SLATE_STRICT_SYMLINKS=0 switches to a purely lexical check (abspath, no
+# filesystem access) for trusted storage where symlink escapes are not a concern.
+STRICT_SYMLINK_CHECK = os.environ.get("SLATE_STRICT_SYMLINKS", "1") != "0"
+
+# Slate count at which path validation switches to a thread pool
+PARALLEL_SLATE_THRESHOLD = 3
+
+# Compiled template bytecode is persisted here so later runs skip compilation
+TEMPLATE_CACHE_DIR = os.path.join(CACHE_DIR, "templates")
+
+# Module-level state for lazy initialization
+_bytecode_cache: Optional[FileSystemBytecodeCache] = None
+_bytecode_cache_checked = False
+
+# One Environment per template directory; Jinja2 keeps compiled templates in the
+# environment's own cache and only re-stats the source to detect edits
+_environments: dict[str, Environment] = {}
+
+# ----------------------------- Template Environment -----------------------------
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Lazily create the shared on-disk Jinja2 bytecode cache.
+
+    Returns:
+        The bytecode cache, or None if TEMPLATE_CACHE_DIR is not writable
+    """
+    global _bytecode_cache, _bytecode_cache_checked
+
+    if _bytecode_cache_checked:
+        return _bytecode_cache
+
+    try:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+        if os.access(TEMPLATE_CACHE_DIR, os.W_OK):
+            _bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+        else:
+            logger.warning(f"Template cache directory is not writable: {TEMPLATE_CACHE_DIR}")
+    except OSError as e:
+        logger.warning(f"Could not create template cache directory: {e}")
+
+    _bytecode_cache_checked = True
+    return _bytecode_cache
+
+
+def _get_environment(template_dir: str) -> Environment:
+    """Return the shared Jinja2 Environment for a template directory.
+
+    Args:
+        template_dir: Directory containing the gallery template
+
+    Returns:
+        Cached Environment, created on first request for this directory
+    """
+    template_dir = os.path.abspath(template_dir)
+    env = _environments.get(template_dir)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=True,
+            bytecode_cache=_get_bytecode_cache(),
+        )
+        env = _environments.setdefault(template_dir, env)
+    return env
+
+# ----------------------------- Path Validation Helpers -----------------------------
+
+
+def _resolve_allowed_roots(allowed_root_dirs: Union[str, list[str]]) -> list[str]:
+    """Resolve allowed roots to sorted, separator-terminated real paths.
+
+    Roots nested inside another allowed root are dropped, which leaves a list of
+    disjoint prefixes that can be searched with bisect.
+
+    Args:
+        allowed_root_dirs: Single root directory or list of root directories
+
+    Returns:
+        Sorted list of real root paths, each ending with os.sep
+    """
+    if isinstance(allowed_root_dirs, str):
+        allowed_root_dirs = [allowed_root_dirs]
+
+    roots: list[str] = []
+    # Roots must be normalized the same way image paths are in _is_image_allowed
+    resolve = os.path.realpath if STRICT_SYMLINK_CHECK else os.path.abspath
+
+    # Dedupe the raw paths first so each distinct root is only resolved once
+    unique_root_dirs = dict.fromkeys(allowed_root_dirs)
+    for real_root in sorted({os.path.join(resolve(d), "") for d in unique_root_dirs}):
+        if not roots or not real_root.startswith(roots[-1]):
+            roots.append(real_root)
+    return roots
+
+
+def _is_within_roots(real_path: str, sorted_roots: list[str]) -> bool:
+    """Check whether real_path lies under one of the roots from _resolve_allowed_roots."""
+    index = bisect_right(sorted_roots, real_path)
+    return index > 0 and real_path.startswith(sorted_roots[index - 1])
+
+
+def _is_image_allowed(path: str, sorted_roots: list[str], dir_verdicts: dict[str, bool]) -> bool:
+    """Check that an image path resolves to a location under an allowed root.
+
+    The verdict is cached per parent directory, so every further image in an
+    already-checked directory costs one lstat and a dict lookup instead of a
+    full realpath walk. With STRICT_SYMLINK_CHECK disabled the check is purely
+    lexical and never touches the filesystem.
+
+    Args:
+        path: Image path as given in the gallery data
+        sorted_roots: Roots as returned by _resolve_allowed_roots
+        dir_verdicts: Cache of parent directory -> verdict shared across one gallery run
+
+    Returns:
+        True if the image may be included in the gallery
+    """
+    if not STRICT_SYMLINK_CHECK:
+        # Lexical check only: pure string work, no syscalls
+        return _is_within_roots(os.path.abspath(path), sorted_roots)
+
+    parent, name = os.path.split(path)
+
+    # A symlinked file can point anywhere, and '.'/'..' components change the
+    # parent, so these always get a full resolve
+    if name in ("", ".", "..") or os.path.islink(path):
+        return _is_within_roots(os.path.realpath(path), sorted_roots)
+
+    verdict = dir_verdicts.get(parent)
+    if verdict is None:
+        verdict = _is_within_roots(os.path.join(os.path.realpath(parent), ""), sorted_roots)
+        dir_verdicts[parent] = verdict
+    return verdict
+
+
+def _filter_slate_images(
+    slate: SlateData, sorted_roots: list[str], dir_verdicts: dict[str, bool]
+) -> tuple[list[str], int]:
+    """Drop disallowed images from a slate in place and set web_path on the rest.
+
+    Safe to run for several slates concurrently: each call only mutates its own
+    slate, and dir_verdicts is only used for idempotent get/set.
+
+    Args:
+        slate: Slate whose "images" list is filtered in place
+        sorted_roots: Roots as returned by _resolve_allowed_roots
+        dir_verdicts: Shared cache of parent directory -> verdict
+
+    Returns:
+        Tuple of (status messages to report, number of skipped images)
+    """
+    messages: list[str] = []
+    skipped_count = 0
+    valid_images: list[ImageData] = []
+
+    # Bind hot-loop callables to locals (avoids global/attribute lookups per image)
+    abspath = os.path.abspath
+    isabs = os.path.isabs
+    backslash_is_sep = _BACKSLASH_IS_SEP
+    is_image_allowed = _is_image_allowed
+    append_valid = valid_images.append
+    allowed_dirs_str: Optional[str] = None  # Built on the first rejection only
+
+    # Single pass per image: security check and web_path construction together
+    for image in slate["images"]:
+        original_path = image["original_path"]
+        try:
+            # Verify path is within one of the allowed root directories
+            if not is_image_allowed(original_path, sorted_roots, dir_verdicts):
+                if allowed_dirs_str is None:
+                    allowed_dirs_str = ", ".join(sorted_roots)
+                logger.error(f"Image path {original_path} is outside of allowed directories: {allowed_dirs_str}")
+                messages.append(f"Skipping image outside of allowed directories: {original_path}")
+                skipped_count += 1
+                continue  # Don't add to valid_images
+
+            # Use absolute path with forward slashes for web. Scanner output is
+            # already absolute, so abspath (and its getcwd call) is rarely needed.
+            absolute_path = original_path if isabs(original_path) else abspath(original_path)
+            if backslash_is_sep:
+                absolute_path = absolute_path.replace("\\", "/")
+            image["web_path"] = f"file://{absolute_path}"
+            append_valid(image)
+
+        except Exception as e:
+            logger.error(f"Error processing image {original_path}: {e}", exc_info=True)
+            messages.append(f"Error processing image {original_path}: {e}")
+            skipped_count += 1
+            continue  # Don't add to valid_images
+
+    # Replace with filtered list (actually removes skipped images)
+    slate["images"] = valid_images
+    return messages, skipped_count
+
+
 # ----------------------------- HTML Gallery Generation -----------------------------
 
 
@@ -40,56 +250,31 @@ def generate_html_gallery(
     """
     skipped_count = 0
     try:
-        # Normalize allowed_root_dirs to a list for uniform handling
-        if isinstance(allowed_root_dirs, str):
-            real_allowed_roots = [os.path.realpath(allowed_root_dirs)]
+        # Resolve allowed roots once; per-directory verdicts are cached and shared
+        real_allowed_roots = _resolve_allowed_roots(allowed_root_dirs)
+        dir_verdicts: dict[str, bool] = {}
+
+        def filter_slate(slate: SlateData) -> tuple[list[str], int]:
+            return _filter_slate_images(slate, real_allowed_roots, dir_verdicts)
+
+        # Path validation is stat-bound (releases the GIL), so slates are checked
+        # concurrently; small galleries stay sequential to avoid pool overhead
+        if len(gallery_data) < PARALLEL_SLATE_THRESHOLD:
+            slate_results = [filter_slate(slate) for slate in gallery_data]
         else:
-            real_allowed_roots = [os.path.realpath(d) for d in allowed_root_dirs]
-
-        # Process image paths and filter out invalid images
-        for slate in gallery_data:
-            valid_images: list[ImageData] = []
-            for image in slate["images"]:
-                original_path = image["original_path"]
-                try:
-                    # Verify path is within one of the allowed root directories
-                    real_original_path = os.path.realpath(original_path)
-
-                    # Check if path starts with any of the allowed roots
-                    is_allowed = any(real_original_path.startswith(real_root) for real_root in real_allowed_roots)
-
-                    if not is_allowed:
-                        allowed_dirs_str = ", ".join(real_allowed_roots)
-                        logger.error(f"Image path {original_path} is outside of allowed directories: {allowed_dirs_str}")
-                        status_callback(f"Skipping image outside of allowed directories: {original_path}")
-                        skipped_count += 1
-                        continue  # Don't add to valid_images
-
-                    # Use absolute path with forward slashes for web
-                    absolute_path = os.path.abspath(original_path)
-                    web_path = "file://" + absolute_path.replace("\\", "/")
-                    image["web_path"] = web_path
-                    valid_images.append(image)
-
-                except Exception as e:
-                    logger.error(f"Error processing image {original_path}: {e}", exc_info=True)
-                    status_callback(f"Error processing image {original_path}: {e}")
-                    skipped_count += 1
-                    continue  # Don't add to valid_images
-
-            # Replace with filtered list (actually removes skipped images)
-            slate["images"] = valid_images
-
-        # Load and render template
-        env = Environment(loader=FileSystemLoader(os.path.dirname(template_path)), autoescape=True)
-        template = env.get_template(os.path.basename(template_path))
+            max_workers = min(len(gallery_data), 32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                slate_results = list(executor.map(filter_slate, gallery_data))
 
-        try:
-            output_html = template.render(gallery=gallery_data, focal_lengths=focal_length_data, dates=date_data, lazy_loading=lazy_loading)
-        except Exception as e:
-            status_callback(f"Error rendering template: {e}")
-            logger.error(f"Error rendering template: {e}", exc_info=True)
-            return (False, skipped_count)
+        # Report from the calling thread, in slate order
+        for messages, slate_skipped in slate_results:
+            skipped_count += slate_skipped
+            for message in messages:
+                status_callback(message)
+
+        # Load template
+        env = _get_environment(os.path.dirname(template_path))
+        template = env.get_template(os.path.basename(template_path))
 
         # Create output directory if needed
         if not os.path.exists(output_dir):
@@ -101,19 +286,37 @@ def generate_html_gallery(
                 logger.error(f"Error creating output directory: {e}", exc_info=True)
                 return (False, skipped_count)
 
-        # Write the HTML file
+        # Stream the rendered HTML straight to disk instead of materializing the whole
+        # document as str and again as bytes. Rendering goes to a temporary file that
+        # replaces index.html only on success, so a failed render never leaves a
+        # truncated gallery behind. The temp name is unique, so two generations into
+        # the same directory never write to, replace or delete each other's file.
+        html_file_path = os.path.join(output_dir, "index.html")
+        tmp_file_path: Optional[str] = None
         try:
-            html_file_path = os.path.join(output_dir, "index.html")
-            with open(html_file_path, "wb") as f:
-                _ = f.write(output_html.encode("utf-8"))
-            status_callback(f"Gallery generated at {os.path.abspath(html_file_path)}")
-            logger.info(f"Gallery generated at {os.path.abspath(html_file_path)}")
-            return (True, skipped_count)
+            stream = template.stream(gallery=gallery_data, focal_lengths=focal_length_data, dates=date_data, lazy_loading=lazy_loading)
+            stream.enable_buffering(size=64)
+            fd, tmp_file_path = tempfile.mkstemp(dir=output_dir, suffix=".html.tmp")
+            with open(fd, "wb", buffering=HTML_WRITE_BUFFER_SIZE) as f:
+                stream.dump(f, encoding="utf-8")
+            os.chmod(tmp_file_path, replacement_file_mode(html_file_path))
+            os.replace(tmp_file_path, html_file_path)
         except Exception as e:
-            status_callback(f"Error writing HTML file: {e}")
-            logger.error(f"Error writing HTML file: {e}", exc_info=True)
+            if tmp_file_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_file_path)
+            if isinstance(e, OSError):
+                status_callback(f"Error writing HTML file: {e}")
+                logger.error(f"Error writing HTML file: {e}", exc_info=True)
+            else:
+                status_callback(f"Error rendering template: {e}")
+                logger.error(f"Error rendering template: {e}", exc_info=True)
             return (False, skipped_count)
 
+        status_callback(f"Gallery generated at {os.path.abspath(html_file_path)}")
+        logger.info(f"Gallery generated at {os.path.abspath(html_file_path)}")
+        return (True, skipped_count)
+
     except Exception as e:
         status_callback(f"Error generating gallery: {e}")
         logger.error(f"Error generating gallery: {e}", exc_info=True)
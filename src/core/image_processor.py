@@ -2,20 +2,195 @@
 
 import hashlib
 import os
+import re
+import struct
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, Optional, Union
 
 from PIL import Image
-from PIL.ExifTags import IFD, TAGS
+from PIL.ExifTags import IFD
+from PIL.TiffImagePlugin import IFDRational
 
 from type_defs import ExifData
 from utils.logging_config import log_function, logger
 
+# Image file extensions picked up by scan_directories (lower-case, without the dot)
+IMAGE_EXTENSIONS = frozenset(("jpg", "jpeg", "png", "tiff", "bmp", "gif"))
+
+# Leading bytes of the formats in IMAGE_EXTENSIONS (JPEG, PNG, TIFF, BMP, GIF)
+IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",
+    b"\x89PNG\r\n\x1a\n",
+    b"II*\x00",
+    b"MM\x00*",
+    b"BM",
+    b"GIF8",
+)
+_SIGNATURE_LENGTH = max(len(signature) for signature in IMAGE_SIGNATURES)
+
+# Thumbnail encoding. Sources are pre-scaled by draft() to 2-4x the target, where
+# BICUBIC is visually indistinguishable from LANCZOS after JPEG quantization
+THUMBNAIL_QUALITY = 85
+THUMBNAIL_RESAMPLE = Image.Resampling.BICUBIC
+
+# Thumbnail directories already created by this process; mkdir is idempotent,
+# so concurrent first calls racing on the set are harmless
+_ensured_thumb_dirs: set[str] = set()
+
+# EXIF tags extracted by get_exif_data, by tag id
+EXIF_WANTED_TAGS = {
+    0x0112: "Orientation",
+    0x0132: "DateTime",
+    0x9003: "DateTimeOriginal",
+    0x9004: "DateTimeDigitized",
+    0x920A: "FocalLength",
+}
+_EXIF_IFD_POINTER = 0x8769
+
+# TIFF field types understood by the JPEG fast path: type id -> struct code
+_TIFF_TYPES = {2: "s", 3: "H", 4: "L", 5: "LL", 9: "l", 10: "ll"}
+_TIFF_TYPE_SIZES = {2: 1, 3: 2, 4: 4, 5: 8, 9: 4, 10: 8}
+
 # ----------------------------- Helper Functions -----------------------------
 
+# Per-image functions (EXIF, date, orientation, thumbnail) are deliberately not
+# wrapped in @log_function: they run once per image and already log their own
+# errors, so the entry/exit wrapper would only add overhead on the hot path.
+
+
+def _read_tiff_value(tiff: bytes, endian: str, entry: int) -> object:
+    """Decode one IFD entry the way Pillow's getexif() would.
+
+    Raises:
+        ValueError: For types or counts the fast path does not handle
+        struct.error: If the entry points outside the TIFF block
+    """
+    field_type, count = struct.unpack_from(endian + "HL", tiff, entry + 2)
+    code = _TIFF_TYPES.get(field_type)
+    if code is None or (field_type != 2 and count != 1):
+        raise ValueError(f"Unsupported EXIF field type {field_type} x{count}")
+
+    size = _TIFF_TYPE_SIZES[field_type] * count
+    offset = entry + 8
+    if size > 4:
+        (offset,) = struct.unpack_from(endian + "L", tiff, offset)
+    if offset + size > len(tiff):
+        raise ValueError("EXIF value outside of segment")
+
+    if field_type == 2:
+        data = tiff[offset:offset + size]
+        if data.endswith(b"\0"):
+            data = data[:-1]
+        return data.decode("latin-1", "replace")
+    values = struct.unpack_from(endian + code, tiff, offset)
+    if len(values) == 2:
+        return IFDRational(values[0], values[1])
+    return values[0]
+
+
+def _read_ifd(tiff: bytes, endian: str, ifd_offset: int, exif_data: ExifData) -> Optional[int]:
+    """Collect wanted tags from one IFD into exif_data (first occurrence wins).
+
+    Returns:
+        Offset of the Exif sub-IFD if this IFD points to one, else None
+    """
+    (count,) = struct.unpack_from(endian + "H", tiff, ifd_offset)
+    exif_ifd_offset: Optional[int] = None
+    for entry in range(ifd_offset + 2, ifd_offset + 2 + 12 * count, 12):
+        (tag,) = struct.unpack_from(endian + "H", tiff, entry)
+        if tag == _EXIF_IFD_POINTER:
+            (exif_ifd_offset,) = struct.unpack_from(endian + "L", tiff, entry + 8)
+            continue
+        name = EXIF_WANTED_TAGS.get(tag)
+        if name is not None and name not in exif_data:
+            exif_data[name] = _read_tiff_value(tiff, endian, entry)  # type: ignore[literal-required]
+    return exif_ifd_offset
+
+
+def _iter_jpeg_segments(f: BinaryIO) -> Iterator[tuple[int, int]]:
+    """Walk the marker segments of a JPEG header up to the image data.
+
+    Yields (marker, payload_length) with the file positioned at the start of
+    the payload. The consumer may read any part of it; the walk seeks past the
+    remainder when resumed.
+
+    Raises:
+        ValueError: If the file is not a JPEG or the header is malformed
+    """
+    if f.read(2) != b"\xff\xd8":
+        raise ValueError("Not a JPEG file")
+    while True:
+        header = f.read(4)
+        if len(header) < 4 or header[0] != 0xFF:
+            raise ValueError("Malformed JPEG header")
+        marker = header[1]
+        if marker in (0xDA, 0xD9):  # Start of scan / end of image
+            return
+        (length,) = struct.unpack(">H", header[2:])
+        payload_start = f.tell()
+        yield marker, length - 2
+        f.seek(payload_start + length - 2)
+
+
+def _read_jpeg_exif(image_path: str) -> Optional[ExifData]:
+    """Read the wanted EXIF tags straight from a JPEG's APP1 segment.
+
+    Only the JPEG marker headers and the APP1 payload are read, and only the
+    IFD0 and Exif IFD entries for EXIF_WANTED_TAGS are decoded.
+
+    Returns:
+        The extracted tags, or None if the file is not a JPEG with a parseable
+        EXIF segment (callers then fall back to Pillow)
+    """
+    try:
+        with open(image_path, "rb") as f:
+            for marker, length in _iter_jpeg_segments(f):
+                if marker == 0xE1:
+                    payload = f.read(length)
+                    if payload.startswith(b"Exif\0\0"):
+                        break
+            else:
+                return None
+
+        tiff = payload[6:]
+        if tiff[:4] == b"II*\0":
+            endian = "<"
+        elif tiff[:4] == b"MM\0*":
+            endian = ">"
+        else:
+            return None
+
+        exif_data: ExifData = {}
+        (ifd0_offset,) = struct.unpack_from(endian + "L", tiff, 4)
+        exif_ifd_offset = _read_ifd(tiff, endian, ifd0_offset, exif_data)
+        if exif_ifd_offset:
+            _read_ifd(tiff, endian, exif_ifd_offset, exif_data)
+        return exif_data
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _read_jpeg_size(image_path: str) -> Optional[tuple[int, int]]:
+    """Read a JPEG's (width, height) from its start-of-frame marker.
+
+    Returns:
+        The image size, or None if the file is not a readable JPEG
+        (callers then fall back to Pillow)
+    """
+    try:
+        with open(image_path, "rb") as f:
+            for marker, _length in _iter_jpeg_segments(f):
+                # SOF0-SOF15, except DHT (C4), JPG (C8) and DAC (CC)
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    _precision, height, width = struct.unpack(">BHH", f.read(5))
+                    return width, height
+    except (OSError, ValueError, struct.error):
+        pass
+    return None
+
 
-@log_function
 def get_exif_data(image_path: str) -> ExifData:
     try:
         # Skip macOS resource fork files as a last line of defense
@@ -23,6 +198,12 @@ def get_exif_data(image_path: str) -> ExifData:
             logger.debug(f"Skipping macOS resource fork file in get_exif_data: {image_path}")
             return {}
 
+        # Fast path for JPEGs: parse the APP1 segment without Pillow
+        fast_exif = _read_jpeg_exif(image_path)
+        if fast_exif is not None:
+            return fast_exif
+
+        wanted_tags = EXIF_WANTED_TAGS
         with Image.open(image_path) as image:
             exif_data: ExifData = {}
 
@@ -30,29 +211,19 @@ def get_exif_data(image_path: str) -> ExifData:
             if hasattr(image, "getexif"):
                 exif = image.getexif()
                 if exif:
-                    # Base EXIF tags
+                    # Base EXIF tags (one dict lookup per entry, keyed on tag id)
                     for tag, value in exif.items():  # type: ignore[attr-defined]
-                        decoded = TAGS.get(tag, tag)
-                        if decoded in (
-                            "FocalLength",
-                            "Orientation",
-                            "DateTime",
-                            "DateTimeOriginal",
-                            "DateTimeDigitized",
-                        ):
-                            exif_data[decoded] = value  # type: ignore[assignment]
+                        decoded = wanted_tags.get(tag)
+                        if decoded is not None:
+                            exif_data[decoded] = value  # type: ignore[literal-required]
 
                     # EXIF IFD (where FocalLength usually resides)
                     try:
                         exif_ifd = exif.get_ifd(IFD.Exif)
                         for tag, value in exif_ifd.items():  # type: ignore[attr-defined]
-                            decoded = TAGS.get(tag, tag)
-                            if (
-                                decoded
-                                in ("FocalLength", "Orientation", "DateTime", "DateTimeOriginal", "DateTimeDigitized")
-                                and decoded not in exif_data
-                            ):
-                                exif_data[decoded] = value  # type: ignore[assignment]
+                            decoded = wanted_tags.get(tag)
+                            if decoded is not None and decoded not in exif_data:
+                                exif_data[decoded] = value  # type: ignore[literal-required]
                     except (KeyError, AttributeError):
                         pass
 
@@ -67,15 +238,9 @@ def get_exif_data(image_path: str) -> ExifData:
                 exifinfo = image_any._getexif()  # type: ignore[attr-defined]
                 if exifinfo:
                     for tag, value in exifinfo.items():  # type: ignore[union-attr]
-                        decoded = TAGS.get(tag, tag)  # type: ignore[arg-type]
-                        if decoded in (
-                            "FocalLength",
-                            "Orientation",
-                            "DateTime",
-                            "DateTimeOriginal",
-                            "DateTimeDigitized",
-                        ):
-                            exif_data[decoded] = value  # type: ignore[assignment]
+                        decoded = wanted_tags.get(tag)  # type: ignore[arg-type]
+                        if decoded is not None:
+                            exif_data[decoded] = value  # type: ignore[literal-required]
 
             return exif_data
     except Exception as e:
@@ -83,7 +248,29 @@ def get_exif_data(image_path: str) -> ExifData:
         return {}
 
 
-@log_function
+def _parse_exif_datetime(value: str) -> datetime:
+    """Parse an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp.
+
+    Well-formed 19-character values are sliced directly; anything else goes
+    through strptime so unusual but valid values keep parsing the same way.
+
+    Raises:
+        ValueError: If the value is not a valid EXIF timestamp
+    """
+    if (
+        len(value) == 19
+        and value[4] == value[7] == value[13] == value[16] == ":"
+        and value[10] == " "
+    ):
+        digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+        if digits.isascii() and digits.isdigit():
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            )
+    return datetime.strptime(value, "%Y:%m:%d %H:%M:%S")
+
+
 def get_image_date(exif_data: ExifData) -> Union[datetime, None]:
     """Extract the best available date from EXIF data.
 
@@ -97,7 +284,7 @@ def get_image_date(exif_data: ExifData) -> Union[datetime, None]:
         if date_str:
             try:
                 # EXIF date format is 'YYYY:MM:DD HH:MM:SS'
-                return datetime.strptime(str(date_str), "%Y:%m:%d %H:%M:%S")  # type: ignore[arg-type]
+                return _parse_exif_datetime(str(date_str))  # type: ignore[arg-type]
             except ValueError as e:
                 logger.warning(f"Invalid date format for {tag}: {date_str}, error: {e}")
                 continue
@@ -105,7 +292,6 @@ def get_image_date(exif_data: ExifData) -> Union[datetime, None]:
     return None
 
 
-@log_function
 def get_orientation(image_path: str, exif_data: ExifData) -> str:
     if "Orientation" in exif_data:
         orientation = exif_data["Orientation"]  # type: ignore[assignment]
@@ -115,25 +301,39 @@ def get_orientation(image_path: str, exif_data: ExifData) -> str:
             return "landscape"
     else:
         try:
-            with Image.open(image_path) as image:
-                width, height = image.size
-                return "portrait" if height > width else "landscape"
+            # JPEG dimensions come from the SOF marker without a Pillow header parse
+            size = _read_jpeg_size(image_path)
+            if size is None:
+                with Image.open(image_path) as image:
+                    size = image.size
+            width, height = size
+            return "portrait" if height > width else "landscape"
         except Exception as e:
             logger.error(f"Error determining orientation for {image_path}: {e}", exc_info=True)
             return "unknown"
 
 
-@log_function
-def scan_directories(root_dir: str, exclude_patterns: str = "") -> dict[str, dict[str, list[str]]]:
+def iter_scan_directories(root_dir: str, exclude_patterns: str = "") -> Iterator[tuple[str, list[str]]]:
+    """Lazily walk a slate root, yielding each directory's images as it is read.
+
+    Lets callers start work on early slates while the rest of the tree is
+    still being listed. scan_directories collects the same results into a dict.
+
+    Args:
+        root_dir: Root directory to scan
+        exclude_patterns: Comma or semicolon separated patterns to exclude
+
+    Yields:
+        (slate_name, image_paths) for every directory containing images, in
+        os.walk order. The root directory's slate is named "/". image_paths
+        are sorted case-insensitively, so consumers need not re-sort them.
+    """
     # QString is no longer needed in PySide6, using native Python strings
     root_dir = str(root_dir)
 
-    image_extensions = [".jpg", ".jpeg", ".png", ".tiff", ".bmp", ".gif"]
-    slates: dict[str, dict[str, list[str]]] = {}
-
     if not os.path.exists(root_dir):
         logger.error(f"Slate directory does not exist: {root_dir}")
-        return slates
+        return
 
     # Parse exclude patterns (comma or semicolon separated)
     import fnmatch
@@ -145,45 +345,100 @@ def scan_directories(root_dir: str, exclude_patterns: str = "") -> dict[str, dic
         patterns = [p for p in raw_patterns if p]
         logger.info(f"Applying exclude patterns: {patterns}")
 
+    # Compile all patterns into one case-insensitive regex so each entry costs a
+    # single match instead of one fnmatch call per pattern
+    exclude_re = (
+        re.compile("|".join(fnmatch.translate(p.lower()) for p in patterns)) if patterns else None
+    )
+
     def should_exclude(path: str) -> bool:
         """Check if path matches any exclude pattern (case-insensitive)"""
-        if not patterns:
+        if exclude_re is None:
             return False
         path_lower = path.lower()
-        for pattern in patterns:
-            # Case-insensitive match
-            if fnmatch.fnmatch(path_lower, pattern.lower()):
-                logger.debug(f"Excluding {path} (matched pattern: {pattern})")
-                return True
-        return False
-
-    for dirpath, dirnames, filenames in os.walk(root_dir, followlinks=False):
-        # Filter out excluded directories (modifying dirnames in-place prevents os.walk from descending)
-        # Exclude dot folders (.git, .venv, etc.) and pattern-matched directories
-        dirnames[:] = [d for d in dirnames if not (d.startswith('.') or should_exclude(d))]
+        if exclude_re.match(path_lower) is None:
+            return False
+        # Only excluded entries pay for finding which pattern matched
+        pattern = next(p for p in patterns if fnmatch.fnmatchcase(path_lower, p.lower()))
+        logger.debug(f"Excluding {path} (matched pattern: {pattern})")
+        return True
+
+    # Iterative pre-order traversal (same order as os.walk, no recursion limit).
+    # os.scandir exposes the file type from readdir, so most entries need no stat.
+    stack: list[tuple[str, str]] = [(root_dir, ".")]
+    while stack:
+        dirpath, relative_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError as e:
+            # os.walk silently skipped unreadable directories; keep that behaviour
+            logger.debug(f"Cannot read directory {dirpath}: {e}")
+            continue
 
         logger.info(f"Scanning directory: {dirpath}")
+        subdirs: list[tuple[str, str]] = []
         images_in_dir: list[str] = []
-        for f in filenames:
-            # Skip macOS resource fork files (._*)
-            if f.startswith("._"):
+        for entry in entries:
+            name = entry.name
+            # Skip macOS resource forks (._*) before any other per-entry work; as
+            # dot-prefixed names they are never descended into either
+            if name.startswith("._"):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Don't follow directory symlinks (is_symlink uses the cached d_type).
+                # Exclude dot folders (.git, .venv, etc.) and pattern-matched directories
+                if not (name.startswith('.') or entry.is_symlink() or should_exclude(name)):
+                    sub_relative = name if relative_dir == "." else os.path.join(relative_dir, name)
+                    subdirs.append((entry.path, sub_relative))
+                continue
+
+            # Extension check first: it is cheaper than the exclude regex and
+            # rejects most non-image files. Same rules as os.path.splitext:
+            # leading dots don't start an extension.
+            stem, dot, ext = name.rpartition(".")
+            if not (dot and ext.lower() in IMAGE_EXTENSIONS and stem.lstrip(".")):
                 continue
 
             # Skip if matches exclude pattern
-            if should_exclude(f):
+            if should_exclude(name):
                 continue
 
-            if os.path.splitext(f)[1].lower() in image_extensions:
-                images_in_dir.append(f)
+            images_in_dir.append(entry.path)
+
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
 
         if images_in_dir:
-            relative_dir = os.path.relpath(dirpath, root_dir)
-            if relative_dir == ".":
-                relative_dir = "/"
-            slates[relative_dir] = {"images": [os.path.join(dirpath, f) for f in images_in_dir]}
-            logger.info(f"Found {len(images_in_dir)} images in slate: {relative_dir}")
+            # Case-insensitive name order, independent of the filesystem's listing order
+            images_in_dir.sort(key=str.lower)
+            slate_name = "/" if relative_dir == "." else relative_dir
+            logger.info(f"Found {len(images_in_dir)} images in slate: {slate_name}")
+            yield slate_name, images_in_dir
 
-    return slates
+
+@log_function
+def scan_directories(root_dir: str, exclude_patterns: str = "") -> dict[str, dict[str, list[str]]]:
+    """Scan a slate root and collect its images per slate.
+
+    Args:
+        root_dir: Root directory to scan
+        exclude_patterns: Comma or semicolon separated patterns to exclude
+
+    Returns:
+        Dictionary mapping slate names (relative paths, "/" for the root) to
+        {"images": [...]}, with each image list sorted case-insensitively
+    """
+    return {
+        slate_name: {"images": images}
+        for slate_name, images in iter_scan_directories(root_dir, exclude_patterns)
+    }
 
 
 @log_function
@@ -242,12 +497,62 @@ def scan_multiple_directories(root_dirs: list[str], exclude_patterns: str = "")
     return merged_slates
 
 
-@log_function
+def _open_image(fp: BinaryIO, image_path: str) -> Image.Image:
+    """Open an image file handle with Pillow after checking its magic bytes.
+
+    Raises:
+        ValueError: If the file does not start with a known image signature
+    """
+    if not fp.read(_SIGNATURE_LENGTH).startswith(IMAGE_SIGNATURES):
+        raise ValueError(f"Not a recognised image file: {image_path}")
+    fp.seek(0)
+    return Image.open(fp)
+
+
+def _is_thumbnail_current(thumb_path: str, source_mtime_ns: int) -> bool:
+    """Check whether an existing thumbnail can be reused without decoding it.
+
+    A thumbnail is reused when it is at least as new as its source image and
+    looks like a complete JPEG (SOI marker at the start, EOI marker at the end).
+    That costs a stat and two tiny reads instead of a full Image.open.
+
+    Args:
+        thumb_path: Path of the thumbnail file
+        source_mtime_ns: Modification time of the source image (st_mtime_ns)
+
+    Returns:
+        True if the thumbnail is usable, False if it is missing, stale or corrupted
+    """
+    try:
+        thumb_mtime_ns = os.stat(thumb_path).st_mtime_ns
+    except OSError:
+        return False  # Not generated yet
+
+    if thumb_mtime_ns < source_mtime_ns:
+        logger.debug(f"Thumbnail older than source image, regenerating: {thumb_path}")
+        return False
+
+    try:
+        with open(thumb_path, "rb") as f:
+            head = f.read(2)
+            f.seek(-2, os.SEEK_END)
+            tail = f.read(2)
+    except OSError:
+        head = tail = b""
+
+    if head == b"\xff\xd8" and tail == b"\xff\xd9":
+        return True
+
+    logger.warning(f"Corrupted thumbnail found, regenerating: {thumb_path}")
+    return False
+
+
 def generate_thumbnail(
     image_path: str,
     thumb_dir: str,
     size: Union[int, tuple[int, int], None] = None,
-    orientation: Optional[int] = None
+    orientation: Optional[int] = None,
+    high_quality: bool = False,
 ) -> dict[str, str]:
     """Generate a thumbnail for an image at specified size.
 
@@ -256,6 +561,9 @@ def generate_thumbnail(
         thumb_dir: Directory to store thumbnails
         size: Single size as an integer (e.g., 600 for 600x600) or tuple (width, height)
         orientation: Optional EXIF orientation value (1-8). If provided, skips EXIF read.
+        high_quality: Resample with LANCZOS instead of the faster default filter.
+            These thumbnails get their own file names so toggling it never reuses
+            thumbnails made with the other filter.
 
     Returns:
         Dict with thumbnail path keyed by size string (e.g., "600x600")
@@ -275,24 +583,54 @@ def generate_thumbnail(
     thumbnails: dict[str, str] = {}
 
     try:
-        # Create a unique filename based on image path hash
-        path_hash = hashlib.md5(image_path.encode()).hexdigest()[:8]
+        # Create a unique filename based on image path hash (a name disambiguator,
+        # not a security hash, so it keeps working on FIPS-restricted builds)
+        path_hash = hashlib.md5(image_path.encode(), usedforsecurity=False).hexdigest()[:8]
         base_name = Path(image_path).stem
+        source_mtime_ns = os.stat(image_path).st_mtime_ns
+        quality_suffix = "_hq" if high_quality else ""
 
-        # Ensure thumbnail directory exists
-        Path(thumb_dir).mkdir(parents=True, exist_ok=True)
-
-        # Open image once for all thumbnails
-        with Image.open(image_path) as img:
-            # Convert RGBA to RGB if necessary
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background
-                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                # Paste image with alpha channel as mask
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                rgb_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = rgb_img
+        # Reuse existing thumbnails before touching the source image at all
+        pending: list[tuple[tuple[int, int], str, str]] = []
+        for size_tuple in sizes:
+            size_str = f"{size_tuple[0]}x{size_tuple[1]}"
+            thumb_filename = f"{base_name}_{path_hash}_{size_str}{quality_suffix}.jpg"
+            thumb_path = os.path.join(thumb_dir, thumb_filename)
+
+            if _is_thumbnail_current(thumb_path, source_mtime_ns):
+                thumbnails[size_str] = thumb_path
+                logger.debug(f"Thumbnail already exists: {thumb_path}")
+            else:
+                pending.append((size_tuple, size_str, thumb_path))
+
+        if not pending:
+            return thumbnails
+
+        resample = Image.Resampling.LANCZOS if high_quality else THUMBNAIL_RESAMPLE
+
+        # Ensure thumbnail directory exists (once per directory per process)
+        if thumb_dir not in _ensured_thumb_dirs:
+            Path(thumb_dir).mkdir(parents=True, exist_ok=True)
+            _ensured_thumb_dirs.add(thumb_dir)
+
+        # Open the file once: sniff its signature, then hand the same handle to
+        # Pillow so invalid files are rejected without trying every decoder
+        with open(image_path, "rb") as fp, _open_image(fp, image_path) as img:
+            # Let libjpeg decode at a reduced DCT scale (1/2, 1/4, 1/8) while staying
+            # at least 2x the largest pending size in both dimensions, so the
+            # resample keeps its quality headroom whatever the EXIF rotation. No-op for
+            # formats without draft support.
+            draft_edge = 2 * max(max(size_tuple) for size_tuple, _, _ in pending)
+            img.draft(None, (draft_edge, draft_edge))
+
+            # Flatten transparency onto white (JPEG has no alpha channel)
+            if 'A' in img.getbands() or (img.mode == 'P' and 'transparency' in img.info):
+                # Composite in place on the white background: one C pass, no channel split
+                background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                background.alpha_composite(img.convert('RGBA'))
+                img = background.convert('RGB')
+            elif img.mode == 'P':
+                img = img.convert('RGB')
 
             # Use provided orientation or extract from EXIF
             if orientation is None:
@@ -309,37 +647,28 @@ def generate_thumbnail(
                 if orientation in rotations:
                     img = img.rotate(rotations[orientation], expand=True)
 
-            for size_tuple in sizes:
-                size_str = f"{size_tuple[0]}x{size_tuple[1]}"
-                thumb_filename = f"{base_name}_{path_hash}_{size_str}.jpg"
-                thumb_path = os.path.join(thumb_dir, thumb_filename)
-
-                # Check if thumbnail already exists
-                if os.path.exists(thumb_path):
-                    # Verify it's not corrupted
-                    try:
-                        with Image.open(thumb_path) as test_img:
-                            test_img.verify()
-                        thumbnails[size_str] = thumb_path
-                        logger.debug(f"Thumbnail already exists: {thumb_path}")
-                        continue
-                    except Exception:
-                        # Corrupted thumbnail, regenerate
-                        logger.warning(f"Corrupted thumbnail found, regenerating: {thumb_path}")
-
-                # Create thumbnail with optimized settings for speed and quality
-                thumb = img.copy()
-                thumb.thumbnail(size_tuple, Image.Resampling.LANCZOS)
-
-                # Save with balanced quality settings
-                # 90% quality is a good balance, no optimize for speed
-                thumb.save(
-                    thumb_path,
-                    'JPEG',
-                    quality=90,
-                    optimize=False,  # Skip for speed
-                    subsampling=1    # Balanced quality/speed
-                )
+            last_index = len(pending) - 1
+            for index, (size_tuple, size_str, thumb_path) in enumerate(pending):
+                # Each size is resampled from the full source, so copy it for all
+                # but the last size; the last one (usually the only one) can
+                # shrink the source in place and skip a full-resolution memcpy
+                thumb = img if index == last_index else img.copy()
+                thumb.thumbnail(size_tuple, resample)
+
+                # Save with balanced quality settings, no optimize for speed
+                save_options = {
+                    'quality': THUMBNAIL_QUALITY,
+                    'optimize': False,  # Skip for speed
+                    'progressive': False,  # Baseline JPEG encodes in a single pass
+                    'subsampling': 1,  # Balanced quality/speed
+                }
+                try:
+                    thumb.save(thumb_path, 'JPEG', **save_options)
+                except FileNotFoundError:
+                    # Directory was removed after it was ensured (e.g. output folder
+                    # deleted between generations): recreate it and retry once
+                    Path(thumb_dir).mkdir(parents=True, exist_ok=True)
+                    thumb.save(thumb_path, 'JPEG', **save_options)
                 thumb.close()  # Explicitly release resources to prevent memory pressure
                 thumbnails[size_str] = thumb_path
                 logger.debug(f"Generated thumbnail: {thumb_path}")
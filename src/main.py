@@ -6,9 +6,14 @@ while maintaining identical functionality to the original.
 """
 
 # System imports
+import contextlib
+import faulthandler
+import logging
 import os
 import sys
-import webbrowser
+from collections import OrderedDict
+from collections.abc import Iterable
+from types import TracebackType
 from typing import Optional, Union
 
 from typing_extensions import override
@@ -18,21 +23,32 @@ sys.path.insert(0, str(os.path.dirname(os.path.abspath(__file__))))
 
 # Qt imports
 from PySide6 import QtWidgets
-from PySide6.QtCore import QObject, QPoint, QRect, QSize, Qt, QTimer, Signal
-from PySide6.QtGui import QAbstractTextDocumentLayout, QAction, QColor, QTextDocument
+from PySide6.QtCore import (
+    QElapsedTimer,
+    QItemSelection,
+    QItemSelectionModel,
+    QLoggingCategory,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    QStringListModel,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAbstractTextDocumentLayout, QAction, QTextDocument
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
     QFileDialog,
-    QGraphicsDropShadowEffect,
     QGridLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMenu,
     QMessageBox,
@@ -47,11 +63,20 @@ from PySide6.QtWidgets import (
 
 from core.cache_manager import ImprovedCacheManager
 from core.config_manager import GalleryConfig, load_config, save_config
-from type_defs import ProcessedResults
+from type_defs import CacheMetadata, ProcessedResults
 
 # Import from our new modular structure
 from utils.logging_config import log_function, logger
-from utils.threading import CacheManagerProtocol, GenerateGalleryThread, ScanThread
+from utils.threading import CacheLoadThread, CacheManagerProtocol, GenerateGalleryThread, ScanThread
+
+# Filters over at most this many slates are not timed for the slow-filter status message
+FILTER_TIMING_MIN_SLATES = 5000
+
+# Slate sets (one per scanned directory selection) kept in memory for Scan to reuse
+RECENT_SLATE_SETS = 4
+
+# User's home directory, resolved once; used as the default root and output directory
+HOME_DIR = os.path.expanduser("~")
 
 
 class HtmlItemDelegate(QStyledItemDelegate):
@@ -83,10 +108,10 @@ class HtmlItemDelegate(QStyledItemDelegate):
         # Get the style
         style: Optional[QStyle] = opt.widget.style() if opt.widget else QApplication.style()
 
-        # Create text document for HTML rendering
+        # Create text document for HTML rendering. No text width is set, so the line
+        # never wraps: rows share one uniform single-line height (see sizeHint)
         doc = QTextDocument()
         doc.setHtml(opt.text)
-        doc.setTextWidth(opt.rect.width())
 
         # Clear text so it won't be drawn by default
         opt.text = ""
@@ -121,9 +146,10 @@ class HtmlItemDelegate(QStyledItemDelegate):
         opt: Any = QStyleOptionViewItem(option)  # pyright: ignore[reportExplicitAny]
         self.initStyleOption(opt, index)
 
+        # Measure the unwrapped line: list_slates uses uniform item sizes, so this hint
+        # (taken from one row) must not depend on how long that row's name is
         doc = QTextDocument()
         doc.setHtml(opt.text)
-        doc.setTextWidth(opt.rect.width() if opt.rect.width() > 0 else 200)
 
         # Add vertical padding for better spacing
         height = int(doc.size().height()) + 12
@@ -157,6 +183,7 @@ COLOR_TERTIARY_TEXT = "#424242"
 COLOR_SURFACE = "#FFFFFF"           # Card backgrounds
 COLOR_BACKGROUND = "#FAFAFA"        # Main background (lighter)
 COLOR_BORDER = "#E0E0E0"
+COLOR_CARD_EDGE = "#D0D0D0"         # Card bottom edge (stands in for a shadow)
 
 COLOR_TEXT_PRIMARY = "#37474F"
 COLOR_TEXT_SECONDARY = "#78909C"
@@ -169,6 +196,263 @@ COLOR_ACCENT = "#FFD54F"            # Yellow - accent actions (Open Gallery)
 COLOR_ACCENT_HOVER = "#FFB74D"
 COLOR_ACCENT_TEXT = "#BF360C"
 
+# Application-wide stylesheet for dialogs, built once at import time
+APP_STYLESHEET = f"""
+    QMessageBox, QFileDialog {{
+        background-color: {COLOR_SURFACE};
+    }}
+    QMessageBox QLabel {{
+        color: {COLOR_TEXT_PRIMARY};
+    }}
+    QMessageBox QPushButton {{
+        background-color: {COLOR_SECONDARY};
+        color: {COLOR_PRIMARY};
+        border: none;
+        padding: {SPACING_SM}px {SPACING_MD}px;
+        border-radius: 6px;
+        min-width: 80px;
+        font-weight: 500;
+    }}
+    QMessageBox QPushButton:hover {{
+        background-color: {COLOR_SECONDARY_HOVER};
+    }}
+    QFileDialog QTreeView {{
+        background-color: {COLOR_SURFACE};
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 6px;
+    }}
+    QFileDialog QTreeView::item:selected {{
+        background-color: {COLOR_SECONDARY};
+        color: {COLOR_PRIMARY};
+    }}
+    QFileDialog QTreeView::item:hover {{
+        background-color: {COLOR_BACKGROUND};
+    }}
+"""
+
+# Main window stylesheet, likewise formatted once instead of per GalleryGeneratorApp
+MAIN_WINDOW_STYLESHEET = f"""
+    /* Main Window */
+    QMainWindow {{
+        background-color: {COLOR_BACKGROUND};
+    }}
+
+    /* Card Widgets */
+    #card {{
+        background-color: {COLOR_SURFACE};
+        border: 1px solid {COLOR_BORDER};
+        border-bottom-color: {COLOR_CARD_EDGE};
+        border-radius: 8px;
+    }}
+
+    #cardTitle {{
+        color: {COLOR_TEXT_PRIMARY};
+        font-size: 14px;
+        font-weight: 600;
+        margin-bottom: {SPACING_SM}px;
+    }}
+
+    /* Button System - Primary (Main Actions) */
+    #primaryButton {{
+        background-color: {COLOR_PRIMARY};
+        color: {COLOR_PRIMARY_TEXT};
+        border: none;
+        border-radius: 6px;
+        padding: {SPACING_MD}px {SPACING_LG}px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 120px;
+    }}
+
+    #primaryButton:hover {{
+        background-color: {COLOR_PRIMARY_HOVER};
+    }}
+
+    #primaryButton:pressed {{
+        background-color: {COLOR_PRIMARY_PRESSED};
+    }}
+
+    #primaryButton:disabled {{
+        background-color: {COLOR_BORDER};
+        color: {COLOR_TEXT_DISABLED};
+    }}
+
+    /* Button System - Secondary (Less Important Actions) */
+    #secondaryButton {{
+        background-color: {COLOR_SECONDARY};
+        color: {COLOR_SECONDARY_TEXT};
+        border: none;
+        border-radius: 6px;
+        padding: {SPACING_SM}px {SPACING_MD}px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 100px;
+    }}
+
+    #secondaryButton:hover {{
+        background-color: {COLOR_SECONDARY_HOVER};
+    }}
+
+    #secondaryButton:pressed {{
+        background-color: #90CAF9;
+    }}
+
+    #secondaryButton:disabled {{
+        background-color: {COLOR_BORDER};
+        color: {COLOR_TEXT_DISABLED};
+    }}
+
+    /* Button System - Tertiary (Minimal Actions) */
+    #tertiaryButton {{
+        background-color: {COLOR_TERTIARY_BG};
+        color: {COLOR_TERTIARY_TEXT};
+        border: 1px solid {COLOR_TERTIARY_BORDER};
+        border-radius: 4px;
+        padding: {SPACING_SM}px {SPACING_MD}px;
+        font-size: 13px;
+        font-weight: normal;
+        min-width: 80px;
+    }}
+
+    #tertiaryButton:hover {{
+        background-color: {COLOR_TERTIARY_HOVER};
+    }}
+
+    #tertiaryButton:pressed {{
+        background-color: {COLOR_SECONDARY};
+    }}
+
+    #tertiaryButton:disabled {{
+        border-color: {COLOR_BORDER};
+        color: {COLOR_TEXT_DISABLED};
+    }}
+
+    /* Button System - Accent (Eye-catching actions like Open Gallery) */
+    #accentButton {{
+        background-color: {COLOR_ACCENT};
+        color: {COLOR_ACCENT_TEXT};
+        border: none;
+        border-radius: 6px;
+        padding: {SPACING_MD}px {SPACING_LG}px;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 100px;
+    }}
+
+    #accentButton:hover {{
+        background-color: {COLOR_ACCENT_HOVER};
+    }}
+
+    #accentButton:pressed {{
+        background-color: #FFA726;
+    }}
+
+    #accentButton:disabled {{
+        background-color: {COLOR_BORDER};
+        color: {COLOR_TEXT_DISABLED};
+    }}
+
+    /* Labels */
+    QLabel {{
+        color: {COLOR_TEXT_PRIMARY};
+        font-size: 13px;
+        font-weight: 500;
+    }}
+
+    #instructionLabel {{
+        color: {COLOR_TEXT_SECONDARY};
+        font-size: 12px;
+        font-weight: normal;
+        margin-bottom: {SPACING_SM}px;
+    }}
+
+    /* Input Fields */
+    QLineEdit, QComboBox {{
+        padding: {SPACING_SM}px {SPACING_MD}px;
+        border: 1px solid {COLOR_BORDER};
+        border-radius: 4px;
+        background-color: {COLOR_SURFACE};
+        color: {COLOR_TEXT_PRIMARY};
+        font-size: 13px;
+    }}
+
+    QLineEdit:focus, QComboBox:focus {{
+        border-color: {COLOR_PRIMARY};
+        outline: none;
+    }}
+
+    QLineEdit:disabled, QComboBox:disabled {{
+        background-color: {COLOR_BACKGROUND};
+        color: {COLOR_TEXT_DISABLED};
+    }}
+
+    /* Slate List */
+    QListView#slateList {{
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 6px;
+        background-color: {COLOR_SURFACE};
+        padding: {SPACING_SM}px;
+        font-size: 13px;
+    }}
+
+    QListView#slateList::item {{
+        padding: {SPACING_SM}px;
+        border-radius: 4px;
+        margin: 2px 0;
+    }}
+
+    QListView#slateList::item:selected {{
+        background-color: #E3F2FD;
+        color: #1565C0;
+        border-left: 3px solid #1976D2;
+    }}
+
+    QListView#slateList::item:selected:hover {{
+        background-color: #BBDEFB;
+        color: #0D47A1;
+    }}
+
+    QListView#slateList::item:hover {{
+        background-color: #F5F5F5;
+    }}
+
+    /* Progress Bar */
+    QProgressBar {{
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 6px;
+        background-color: {COLOR_BACKGROUND};
+        text-align: center;
+        height: 24px;
+        font-size: 12px;
+        font-weight: 500;
+    }}
+
+    QProgressBar::chunk {{
+        background-color: {COLOR_PRIMARY};
+        border-radius: 4px;
+    }}
+
+    /* Checkboxes */
+    QCheckBox {{
+        font-size: 13px;
+        font-weight: 500;
+        color: {COLOR_TEXT_PRIMARY};
+        spacing: {SPACING_SM}px;
+    }}
+
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border: 2px solid {COLOR_BORDER};
+        border-radius: 4px;
+    }}
+
+    QCheckBox::indicator:checked {{
+        background-color: {COLOR_PRIMARY};
+        border-color: {COLOR_PRIMARY};
+    }}
+"""
+
 # ----------------------------- Custom File Dialog -----------------------------
 
 
@@ -178,6 +462,10 @@ class CustomFileDialog(QFileDialog):
         QFileDialog.__init__(self, *args)  # type: ignore[arg-type]
         self.setOption(QFileDialog.Option.DontUseNativeDialog, True)
         self.setFileMode(QFileDialog.FileMode.Directory)
+        # List directories only (as getExistingDirectory does) and skip per-folder custom
+        # icon lookups, so opening a photo folder doesn't stat thousands of image files
+        self.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        self.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
 
         # Enable multi-selection if requested
         if multi_select:
@@ -185,35 +473,17 @@ class CustomFileDialog(QFileDialog):
             for view in self.findChildren(QtWidgets.QAbstractItemView):
                 view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
 
-        # Create path input widget (though it appears unused in current implementation)
-        self.path_input = QLineEdit()
-
-        _ = self.directoryEntered.connect(self.update_path_input)
-
-        current_path = self.directory().absolutePath()
-        self.update_path_input(current_path)
-
-    @log_function
-    def navigate_to_path(self):
-        path = str(self.path_input.text())
-        if os.path.exists(path):
-            self.setDirectory(path)
-        else:
-            _ = QMessageBox.warning(self, "Invalid Path", "The specified path does not exist.")
-            logger.warning(f"User attempted to navigate to invalid path: {path}")
-
-    @log_function
-    def update_path_input(self, path: object) -> None:
-        path_str = str(path)
-        self.path_input.setText(path_str)
-        logger.debug(f"Directory changed to: {path_str}")
-
 
 # ----------------------------- Card Widget -----------------------------
 
 
 class CardWidget(QWidget):
-    """Modern card widget with optional title and shadow effect."""
+    """Modern card widget with optional title.
+
+    The lifted look comes from the #card stylesheet rule (darker bottom edge) rather
+    than a QGraphicsDropShadowEffect, which would re-render and blur the whole card,
+    slate list included, offscreen on every repaint.
+    """
 
     def __init__(self, title: str = "", parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -234,12 +504,47 @@ class CardWidget(QWidget):
         self.content_layout = QVBoxLayout()
         layout.addLayout(self.content_layout)
 
-        # Add very subtle shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(8)
-        shadow.setOffset(0, 1)
-        shadow.setColor(QColor(0, 0, 0, 10))  # Very light shadow
-        self.setGraphicsEffect(shadow)
+
+# ----------------------------- Signal Throttler -----------------------------
+
+
+class SignalThrottler(QObject):
+    """Rate-limit a burst of calls to at most one ``triggered`` emission per interval.
+
+    The first call of a burst emits immediately (leading edge); further calls within
+    the interval are collapsed into a single emission when it elapses (trailing edge),
+    so the last call of a burst is never lost.
+    """
+
+    triggered: Signal = Signal()  # type: ignore[misc]
+
+    def __init__(self, interval_ms: int, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        _ = self._timer.timeout.connect(self._on_timeout)
+
+    def throttle(self) -> None:
+        """Request an emission, immediately or at the end of the current interval."""
+        if self._timer.isActive():
+            self._pending = True
+            return
+        self._timer.start()
+        self.triggered.emit()
+
+    def cancel(self) -> None:
+        """Drop any pending trailing emission."""
+        self._pending = False
+        self._timer.stop()
+
+    def _on_timeout(self) -> None:
+        if self._pending:
+            self._pending = False
+            # Keep throttling calls that arrive while the trailing emission is handled
+            self._timer.start()
+            self.triggered.emit()
 
 
 class ThreadCoordinator(QObject):
@@ -318,6 +623,7 @@ class ThreadCoordinator(QObject):
         generate_thumbnails: bool,
         thumbnail_size: int,
         lazy_loading: bool,
+        high_quality_thumbnails: bool = False,
     ) -> bool:
         """Start gallery generation.
 
@@ -338,6 +644,7 @@ class ThreadCoordinator(QObject):
             generate_thumbnails=generate_thumbnails,
             thumbnail_size=thumbnail_size,
             lazy_loading=lazy_loading,
+            high_quality_thumbnails=high_quality_thumbnails,
         )
         self._gallery_thread.progress.connect(self.gallery_progress.emit)
         self._gallery_thread.gallery_complete.connect(self._on_gallery_complete)
@@ -405,10 +712,12 @@ class GalleryGeneratorApp(QMainWindow):
     lbl_filter_count: QLabel  # pyright: ignore[reportUninitializedInstanceVariable]
     txt_filter: QLineEdit  # pyright: ignore[reportUninitializedInstanceVariable]
     txt_exclude: QLineEdit  # pyright: ignore[reportUninitializedInstanceVariable]
-    list_slates: QListWidget  # pyright: ignore[reportUninitializedInstanceVariable]
+    list_slates: QListView  # pyright: ignore[reportUninitializedInstanceVariable]
+    slate_model: QStringListModel  # pyright: ignore[reportUninitializedInstanceVariable]
     btn_refresh: QPushButton  # pyright: ignore[reportUninitializedInstanceVariable]
     chk_generate_thumbnails: QCheckBox  # pyright: ignore[reportUninitializedInstanceVariable]
     combo_thumbnail_size: QComboBox  # pyright: ignore[reportUninitializedInstanceVariable]
+    chk_high_quality_thumbnails: QCheckBox  # pyright: ignore[reportUninitializedInstanceVariable]
     chk_lazy_loading: QCheckBox  # pyright: ignore[reportUninitializedInstanceVariable]
     btn_generate: QPushButton  # pyright: ignore[reportUninitializedInstanceVariable]
     btn_open_gallery: QPushButton  # pyright: ignore[reportUninitializedInstanceVariable]
@@ -428,33 +737,66 @@ class GalleryGeneratorApp(QMainWindow):
         self.selected_slate_dirs = self.config.selected_slate_dirs
         self.generate_thumbnails_pref = self.config.generate_thumbnails
         self.thumbnail_size = self.config.thumbnail_size
+        self.high_quality_thumbnails_pref = self.config.high_quality_thumbnails
         self.lazy_loading_pref = self.config.lazy_loading
         self.exclude_patterns_pref = self.config.exclude_patterns
-        self.output_dir = os.path.expanduser("~")
+        self.output_dir = HOME_DIR
 
         self.cache_manager = ImprovedCacheManager(
-            base_dir=os.path.expanduser("~/.slate_gallery"), max_workers=4, batch_size=100
+            base_dir=os.path.join(HOME_DIR, ".slate_gallery"), max_workers=4, batch_size=100
         )
 
         if not self.current_root_dir:
-            self.current_root_dir = os.path.expanduser("~")
+            self.current_root_dir = HOME_DIR
             self.cached_root_dirs.append(self.current_root_dir)
             self._sync_config_and_save()
             logger.info(f"Default root directory set to home directory: {self.current_root_dir}")
 
         self.slates_dict: ProcessedResults = {}
-        self.filtered_slates: ProcessedResults = {}
-        self.unique_focal_lengths: set[object] = set()
+        # Names of the slates passing the current filters, in _slate_keys order
+        self._visible_keys: list[str] = []
+        # Slate names in list_slates row order, used to map rows back to slates
+        self._listed_keys: list[str] = []
+        # slates_dict the listed rows were rendered from (image counts come from it)
+        self._listed_slates: Optional[ProcessedResults] = None
+        # Sorted slate names and their lowercased forms, index-aligned with each other
+        # and rebuilt only when slates_dict is replaced (see _set_slates)
+        self._slate_keys: list[str] = []
+        self._slate_keys_lower: list[str] = []
+        # Last inclusion filter text and the (name, lowercased name) pairs it matched,
+        # so a narrower filter can rescan just those instead of every slate
+        self._last_filter_text = ""
+        self._last_filter_pairs: list[tuple[str, str]] = []
+        # (filter, exclude) texts behind the current list, so a throttled pass that
+        # finds them unchanged (e.g. text typed and deleted again) can skip the rebuild
+        self._applied_filter_texts: Optional[tuple[str, str]] = None
+        # Recently loaded or scanned slates and their cache metadata, keyed by directory
+        # selection, least recently used first; Scan validates an entry from its own
+        # metadata instead of parsing the cache file again
+        self._recent_slates: OrderedDict[tuple[str, ...], tuple[ProcessedResults, CacheMetadata]] = OrderedDict()
 
         # Thread attributes - initialized dynamically when needed
+        self.cache_load_thread: Optional[CacheLoadThread] = None
         self.scan_thread: Optional[ScanThread] = None
         self.gallery_thread: Optional[GenerateGalleryThread] = None
 
-        # Set up debounced filtering timer
-        self.filter_timer = QTimer()
-        self.filter_timer.setSingleShot(True)  # Only fire once per timeout period
-        _ = self.filter_timer.timeout.connect(self.apply_filters_debounced)
-        self.filter_delay = 300  # 300ms delay after user stops typing
+        # Throttle filtering: the first keystroke filters at once, later ones at most
+        # once per filter_delay ms, with a final pass after the last keystroke
+        self.filter_delay = 300
+        self.filter_throttler = SignalThrottler(self.filter_delay, self)
+        _ = self.filter_throttler.triggered.connect(self.apply_filters_debounced)
+
+        # Coalesce config writes from UI handlers: at most one save per second,
+        # with a final flush in closeEvent (or on aboutToQuit, see below)
+        self.config_save_timer = QTimer()
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(1000)
+        _ = self.config_save_timer.timeout.connect(self._sync_config_and_save)
+        # Flush a pending save if the application quits without closing this window
+        # (e.g. session logout); closeEvent flushes on a normal close
+        app = QApplication.instance()
+        if app is not None:
+            _ = app.aboutToQuit.connect(self._flush_config_save)
 
         # Set up the UI
         self.setup_style()
@@ -463,20 +805,92 @@ class GalleryGeneratorApp(QMainWindow):
         # Restore selected directories display from config
         self.update_selected_dirs_display()
 
-        # Load cached slates if available
+        # Load cached slates in the background so the window paints immediately
         if self.current_root_dir:
-            cached_slates = self.cache_manager.load_cache(self.current_root_dir)
-            if cached_slates:
-                self.slates_dict = cached_slates
-                self.apply_filters()
-                # Check if cache is still valid
-                if self.cache_manager.validate_cache(self.current_root_dir):
-                    self.update_status(f"Loaded {len(cached_slates)} collections from cache (ready to generate)")
-                else:
-                    self.update_status(f"Loaded {len(cached_slates)} collections (cache may be outdated - click Scan to refresh)")
-                self.progress_bar.setValue(100)
+            self._start_cache_load(self.current_root_dir)
+
+    def _start_cache_load(self, root_dir: str) -> None:
+        """Load and validate the cache for root_dir on a worker thread."""
+        self.update_status("Loading cached slates...")
+        self.progress_bar.setRange(0, 0)  # Indeterminate until the cache is loaded
+        self.progress_bar.setVisible(True)
+        self.cache_load_thread = CacheLoadThread(root_dir, self.cache_manager)
+        _ = self.cache_load_thread.cache_loaded.connect(self.on_cache_loaded)
+        self.cache_load_thread.start()
+
+    def on_cache_loaded(self, slates_dict: ProcessedResults, metadata: Optional[CacheMetadata], is_valid: bool) -> None:
+        self.progress_bar.setRange(0, 100)
+
+        # A scan started while the cache was loading supersedes it
+        if self.slates_dict or (self.scan_thread is not None and self.scan_thread.isRunning()):
+            logger.info("Ignoring startup cache; slates were loaded by a newer scan")
+            return
+
+        self.progress_bar.setVisible(False)
+        if slates_dict:
+            root_dir = self.cache_load_thread.root_dir if self.cache_load_thread else self.current_root_dir
+            self._set_slates(slates_dict, cache_key=self._slates_key([root_dir]), metadata=metadata)
+            self.apply_filters()
+            if is_valid:
+                self.update_status(f"Loaded {len(slates_dict)} collections from cache (ready to generate)")
             else:
-                self.update_status("No cache found. Please scan directory.")
+                self.update_status(f"Loaded {len(slates_dict)} collections (cache may be outdated - click Scan to refresh)")
+            self.progress_bar.setValue(100)
+        else:
+            self.update_status("No cache found. Please scan directory.")
+
+    def _set_slates(
+        self,
+        slates_dict: ProcessedResults,
+        cache_key: Optional[tuple[str, ...]] = None,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> None:
+        """Replace the scanned slates and rebuild the sorted name index used by filtering.
+
+        Args:
+            slates_dict: The new slates
+            cache_key: Directories whose cache (or fresh scan) slates_dict holds, letting
+                on_scan reuse it instead of parsing the same cache file again
+            metadata: Cache metadata describing slates_dict; slates without it are
+                not kept for reuse, since on_scan could not validate them
+        """
+        self.slates_dict = slates_dict
+        if cache_key is not None and metadata is not None:
+            self._recent_slates[cache_key] = (slates_dict, metadata)
+            self._recent_slates.move_to_end(cache_key)
+            if len(self._recent_slates) > RECENT_SLATE_SETS:
+                _ = self._recent_slates.popitem(last=False)
+        # Sorted once here so filtered subsets come out in display order
+        self._slate_keys = sorted(slates_dict)
+        self._slate_keys_lower = [slate.lower() for slate in self._slate_keys]
+        self._last_filter_text = ""
+        self._last_filter_pairs = []
+
+    @staticmethod
+    def _slates_key(root_dirs: list[str]) -> tuple[str, ...]:
+        """Return the _recent_slates key for a directory selection.
+
+        Sorted like the composite cache file name, so the same directories picked
+        in a different order share one entry.
+        """
+        return tuple(sorted(root_dirs))
+
+    def _is_selected_cache_valid(self, metadata: Optional[CacheMetadata]) -> bool:
+        """Check cache metadata against the current state of the selected directories."""
+        if len(self.selected_slate_dirs) == 1:
+            return self.cache_manager.validate_metadata(self.selected_slate_dirs[0], metadata)
+        return self.cache_manager.validate_composite_metadata(self.selected_slate_dirs, metadata)
+
+    def _schedule_config_save(self) -> None:
+        """Save the configuration shortly, unless a save is already pending."""
+        if not self.config_save_timer.isActive():
+            self.config_save_timer.start()
+
+    def _flush_config_save(self) -> None:
+        """Write a pending coalesced config save now."""
+        if self.config_save_timer.isActive():
+            self.config_save_timer.stop()
+            self._sync_config_and_save()
 
     def _sync_config_and_save(self) -> None:
         """Sync alias attributes back to config dataclass and save."""
@@ -485,231 +899,13 @@ class GalleryGeneratorApp(QMainWindow):
         self.config.selected_slate_dirs = self.selected_slate_dirs
         self.config.generate_thumbnails = self.generate_thumbnails_pref
         self.config.thumbnail_size = self.thumbnail_size
+        self.config.high_quality_thumbnails = self.high_quality_thumbnails_pref
         self.config.lazy_loading = self.lazy_loading_pref
         self.config.exclude_patterns = self.exclude_patterns_pref
         save_config(self.config)
 
     def setup_style(self) -> None:
-        self.setStyleSheet(f"""
-            /* Main Window */
-            QMainWindow {{
-                background-color: {COLOR_BACKGROUND};
-            }}
-
-            /* Card Widgets */
-            #card {{
-                background-color: {COLOR_SURFACE};
-                border: 1px solid {COLOR_BORDER};
-                border-radius: 8px;
-            }}
-
-            #cardTitle {{
-                color: {COLOR_TEXT_PRIMARY};
-                font-size: 14px;
-                font-weight: 600;
-                margin-bottom: {SPACING_SM}px;
-            }}
-
-            /* Button System - Primary (Main Actions) */
-            #primaryButton {{
-                background-color: {COLOR_PRIMARY};
-                color: {COLOR_PRIMARY_TEXT};
-                border: none;
-                border-radius: 6px;
-                padding: {SPACING_MD}px {SPACING_LG}px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 120px;
-            }}
-
-            #primaryButton:hover {{
-                background-color: {COLOR_PRIMARY_HOVER};
-            }}
-
-            #primaryButton:pressed {{
-                background-color: {COLOR_PRIMARY_PRESSED};
-            }}
-
-            #primaryButton:disabled {{
-                background-color: {COLOR_BORDER};
-                color: {COLOR_TEXT_DISABLED};
-            }}
-
-            /* Button System - Secondary (Less Important Actions) */
-            #secondaryButton {{
-                background-color: {COLOR_SECONDARY};
-                color: {COLOR_SECONDARY_TEXT};
-                border: none;
-                border-radius: 6px;
-                padding: {SPACING_SM}px {SPACING_MD}px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-            }}
-
-            #secondaryButton:hover {{
-                background-color: {COLOR_SECONDARY_HOVER};
-            }}
-
-            #secondaryButton:pressed {{
-                background-color: #90CAF9;
-            }}
-
-            #secondaryButton:disabled {{
-                background-color: {COLOR_BORDER};
-                color: {COLOR_TEXT_DISABLED};
-            }}
-
-            /* Button System - Tertiary (Minimal Actions) */
-            #tertiaryButton {{
-                background-color: {COLOR_TERTIARY_BG};
-                color: {COLOR_TERTIARY_TEXT};
-                border: 1px solid {COLOR_TERTIARY_BORDER};
-                border-radius: 4px;
-                padding: {SPACING_SM}px {SPACING_MD}px;
-                font-size: 13px;
-                font-weight: normal;
-                min-width: 80px;
-            }}
-
-            #tertiaryButton:hover {{
-                background-color: {COLOR_TERTIARY_HOVER};
-            }}
-
-            #tertiaryButton:pressed {{
-                background-color: {COLOR_SECONDARY};
-            }}
-
-            #tertiaryButton:disabled {{
-                border-color: {COLOR_BORDER};
-                color: {COLOR_TEXT_DISABLED};
-            }}
-
-            /* Button System - Accent (Eye-catching actions like Open Gallery) */
-            #accentButton {{
-                background-color: {COLOR_ACCENT};
-                color: {COLOR_ACCENT_TEXT};
-                border: none;
-                border-radius: 6px;
-                padding: {SPACING_MD}px {SPACING_LG}px;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-            }}
-
-            #accentButton:hover {{
-                background-color: {COLOR_ACCENT_HOVER};
-            }}
-
-            #accentButton:pressed {{
-                background-color: #FFA726;
-            }}
-
-            #accentButton:disabled {{
-                background-color: {COLOR_BORDER};
-                color: {COLOR_TEXT_DISABLED};
-            }}
-
-            /* Labels */
-            QLabel {{
-                color: {COLOR_TEXT_PRIMARY};
-                font-size: 13px;
-                font-weight: 500;
-            }}
-
-            #instructionLabel {{
-                color: {COLOR_TEXT_SECONDARY};
-                font-size: 12px;
-                font-weight: normal;
-                margin-bottom: {SPACING_SM}px;
-            }}
-
-            /* Input Fields */
-            QLineEdit, QComboBox {{
-                padding: {SPACING_SM}px {SPACING_MD}px;
-                border: 1px solid {COLOR_BORDER};
-                border-radius: 4px;
-                background-color: {COLOR_SURFACE};
-                color: {COLOR_TEXT_PRIMARY};
-                font-size: 13px;
-            }}
-
-            QLineEdit:focus, QComboBox:focus {{
-                border-color: {COLOR_PRIMARY};
-                outline: none;
-            }}
-
-            QLineEdit:disabled, QComboBox:disabled {{
-                background-color: {COLOR_BACKGROUND};
-                color: {COLOR_TEXT_DISABLED};
-            }}
-
-            /* List Widget */
-            QListWidget {{
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 6px;
-                background-color: {COLOR_SURFACE};
-                padding: {SPACING_SM}px;
-                font-size: 13px;
-            }}
-
-            QListWidget::item {{
-                padding: {SPACING_SM}px;
-                border-radius: 4px;
-                margin: 2px 0;
-            }}
-
-            QListWidget::item:selected {{
-                background-color: #E3F2FD;
-                color: #1565C0;
-                border-left: 3px solid #1976D2;
-            }}
-
-            QListWidget::item:selected:hover {{
-                background-color: #BBDEFB;
-                color: #0D47A1;
-            }}
-
-            QListWidget::item:hover {{
-                background-color: #F5F5F5;
-            }}
-
-            /* Progress Bar */
-            QProgressBar {{
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 6px;
-                background-color: {COLOR_BACKGROUND};
-                text-align: center;
-                height: 24px;
-                font-size: 12px;
-                font-weight: 500;
-            }}
-
-            QProgressBar::chunk {{
-                background-color: {COLOR_PRIMARY};
-                border-radius: 4px;
-            }}
-
-            /* Checkboxes */
-            QCheckBox {{
-                font-size: 13px;
-                font-weight: 500;
-                color: {COLOR_TEXT_PRIMARY};
-                spacing: {SPACING_SM}px;
-            }}
-
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 4px;
-            }}
-
-            QCheckBox::indicator:checked {{
-                background-color: {COLOR_PRIMARY};
-                border-color: {COLOR_PRIMARY};
-            }}
-        """)
+        self.setStyleSheet(MAIN_WINDOW_STYLESHEET)
 
     def _create_directory_card(self) -> CardWidget:
         """Create the directory selection card with browse and scan buttons."""
@@ -802,10 +998,18 @@ class GalleryGeneratorApp(QMainWindow):
         list_buttons_layout = QHBoxLayout()
         list_buttons_layout.setSpacing(SPACING_MD)
 
-        # Collections list with standard Qt multi-selection
-        self.list_slates = QListWidget()
+        # Collections list with standard Qt multi-selection, backed by a string list
+        # model so repopulating is a single model reset rather than per-item widgets
+        self.slate_model = QStringListModel(self)
+        self.list_slates = QListView()
+        self.list_slates.setObjectName("slateList")
+        self.list_slates.setModel(self.slate_model)
+        self.list_slates.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.list_slates.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.list_slates.setItemDelegate(HtmlItemDelegate(self.list_slates))
+        # Every row is one line of the same font, so size them all from the first row
+        # instead of laying out an HTML document per row for its size hint
+        self.list_slates.setUniformItemSizes(True)
         self.list_slates.setMinimumHeight(200)
         self.list_slates.setSizePolicy(
             QtWidgets.QSizePolicy.Policy.Expanding,
@@ -879,9 +1083,20 @@ class GalleryGeneratorApp(QMainWindow):
         # Enable/disable based on checkbox state
         self.combo_thumbnail_size.setEnabled(self.chk_generate_thumbnails.isChecked())
 
+        # Opt back into LANCZOS resampling
+        self.chk_high_quality_thumbnails = QCheckBox("High quality")
+        self.chk_high_quality_thumbnails.setChecked(self.high_quality_thumbnails_pref)
+        self.chk_high_quality_thumbnails.setToolTip(
+            "Resample thumbnails with LANCZOS instead of BICUBIC.\n" +
+            "Slower, and rarely visible after JPEG compression."
+        )
+        _ = self.chk_high_quality_thumbnails.stateChanged.connect(self.on_high_quality_pref_changed)
+        self.chk_high_quality_thumbnails.setEnabled(self.chk_generate_thumbnails.isChecked())
+
         thumbnail_layout.addWidget(self.chk_generate_thumbnails)
         thumbnail_layout.addWidget(thumbnail_size_label)
         thumbnail_layout.addWidget(self.combo_thumbnail_size)
+        thumbnail_layout.addWidget(self.chk_high_quality_thumbnails)
         thumbnail_layout.addStretch()
 
         options_card.content_layout.addLayout(thumbnail_layout)
@@ -953,7 +1168,7 @@ class GalleryGeneratorApp(QMainWindow):
         if new_dir and new_dir not in self.cached_root_dirs:
             self.cached_root_dirs.append(new_dir)
             self.current_root_dir = new_dir
-            self._sync_config_and_save()
+            self._schedule_config_save()
             logger.info(f"Added new directory to cached slate directories: {new_dir}")
 
     @log_function
@@ -961,7 +1176,7 @@ class GalleryGeneratorApp(QMainWindow):
         """Browse for directories with multi-select support."""
         try:
             # Use current directory or first cached as starting point
-            start_dir = self.current_root_dir if self.current_root_dir else (self.cached_root_dirs[0] if self.cached_root_dirs else os.path.expanduser("~"))
+            start_dir = self.current_root_dir if self.current_root_dir else (self.cached_root_dirs[0] if self.cached_root_dirs else HOME_DIR)
 
             dialog = CustomFileDialog(self, "Select Photo Directories (Ctrl/Cmd+Click for multiple)", start_dir, multi_select=True)
 
@@ -974,9 +1189,12 @@ class GalleryGeneratorApp(QMainWindow):
                     # Update current_root_dir to first selected for compatibility
                     self.current_root_dir = self.selected_slate_dirs[0]
 
-                    # Update cached directories (add any new ones)
+                    # Update cached directories (add any new ones); a set avoids a
+                    # linear scan of the history for every selected directory
+                    known_dirs = set(self.cached_root_dirs)
                     for dir_path in self.selected_slate_dirs:
-                        if dir_path not in self.cached_root_dirs:
+                        if dir_path not in known_dirs:
+                            known_dirs.add(dir_path)
                             self.cached_root_dirs.append(dir_path)
 
                     # Update display
@@ -985,7 +1203,7 @@ class GalleryGeneratorApp(QMainWindow):
                     # Update preferences from UI and save configuration
                     self.generate_thumbnails_pref = self.chk_generate_thumbnails.isChecked()
                     self.lazy_loading_pref = self.chk_lazy_loading.isChecked()
-                    self._sync_config_and_save()
+                    self._schedule_config_save()
 
                     logger.info(f"Selected {len(self.selected_slate_dirs)} directories: {self.selected_slate_dirs}")
                     self.update_status(f"Selected {len(self.selected_slate_dirs)} director{'y' if len(self.selected_slate_dirs) == 1 else 'ies'}")
@@ -1039,26 +1257,39 @@ class GalleryGeneratorApp(QMainWindow):
             logger.info(f"Scanning {len(self.selected_slate_dirs)} directories: {self.selected_slate_dirs}")
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
-            self.slates_dict = {}
-            self.filtered_slates = {}
-            self.unique_focal_lengths = set()
-            self.list_slates.clear()
 
-            # Check cache (single directory or composite for multiple)
-            cached_slates = None
+            # Slates already in memory for exactly these directories (startup cache
+            # load or a recent scan) are reused instead of parsing the cache again;
+            # they are still validated below, from the metadata kept with them
+            scan_key = self._slates_key(self.selected_slate_dirs)
+            recent = self._recent_slates.get(scan_key)
+
+            self._set_slates({})
+            self._visible_keys = []
+            self.slate_model.setStringList([])
+            self._listed_keys = []
+
+            # Check cache (single directory or composite for multiple); the file is
+            # parsed at most once, and validity comes from the metadata loaded with it
+            cached_slates: Optional[ProcessedResults] = None
+            metadata: Optional[CacheMetadata] = None
             cache_valid = False
-
-            if len(self.selected_slate_dirs) == 1:
-                cached_slates = self.cache_manager.load_cache(self.selected_slate_dirs[0])
-                cache_valid = self.cache_manager.validate_cache(self.selected_slate_dirs[0]) if cached_slates else False
-            else:
-                cached_slates = self.cache_manager.load_composite_cache(self.selected_slate_dirs)
-                cache_valid = self.cache_manager.validate_composite_cache(self.selected_slate_dirs) if cached_slates else False
+            if recent is not None:
+                cached_slates, metadata = recent
+                cache_valid = self._is_selected_cache_valid(metadata)
+            if not cache_valid:
+                # Stale slates in memory: the cache file may have been refreshed since
+                # (e.g. by another instance), so read it before declaring it outdated
+                if len(self.selected_slate_dirs) == 1:
+                    cached_slates, metadata = self.cache_manager.load_cache_with_metadata(self.selected_slate_dirs[0])
+                else:
+                    cached_slates, metadata = self.cache_manager.load_composite_cache_with_metadata(self.selected_slate_dirs)
+                cache_valid = bool(cached_slates) and self._is_selected_cache_valid(metadata)
 
             if cached_slates:
                 if cache_valid:
                     # Cache is valid - use it directly
-                    self.slates_dict = cached_slates
+                    self._set_slates(cached_slates, cache_key=scan_key, metadata=metadata)
                     self.apply_filters()
                     self.update_status("Loaded slates from cache.")
                     self.progress_bar.setValue(100)  # type: ignore[union-attr]
@@ -1077,7 +1308,7 @@ class GalleryGeneratorApp(QMainWindow):
                         QMessageBox.StandardButton.No  # Default to re-scan for safety
                     )
                     if reply == QMessageBox.StandardButton.Yes:
-                        self.slates_dict = cached_slates
+                        self._set_slates(cached_slates, cache_key=scan_key, metadata=metadata)
                         self.apply_filters()
                         self.update_status("Using outdated cache (re-scan recommended)")
                         self.progress_bar.setValue(100)  # type: ignore[union-attr]
@@ -1103,7 +1334,11 @@ class GalleryGeneratorApp(QMainWindow):
             logger.error(f"Error initiating scan: {e}", exc_info=True)
 
     def on_scan_complete(self, slates_dict: ProcessedResults, message: str) -> None:
-        self.slates_dict = slates_dict
+        # The scan thread saved these slates to the cache for its directories; keep the
+        # metadata it wrote so a later Scan can validate them without the file
+        scan_key = self._slates_key(self.scan_thread.root_dirs) if self.scan_thread else None
+        metadata = self.scan_thread.cache_metadata if self.scan_thread else None
+        self._set_slates(slates_dict, cache_key=scan_key, metadata=metadata)
         self.apply_filters()
         self.update_status(message)
         self.progress_bar.setValue(100)
@@ -1119,26 +1354,20 @@ class GalleryGeneratorApp(QMainWindow):
         logger.debug(f"Scan progress: {progress}%")
 
     def on_filter(self) -> None:
-        """Handle filter text changes with debouncing to improve UI responsiveness."""
+        """Handle filter text changes with throttling to improve UI responsiveness."""
         try:
-            # Stop any pending filter operation
-            self.filter_timer.stop()
-
-            # Start new timer - will trigger apply_filters_debounced after delay
-            self.filter_timer.start(self.filter_delay)
-
-            logger.debug(f"Filter timer started (delay: {self.filter_delay}ms)")
+            self.filter_throttler.throttle()
         except Exception as e:
             self.update_status(f"Error during filter setup: {e}")
             logger.error(f"Error during filter setup: {e}", exc_info=True)
 
     def _on_slate_context_menu(self, position: QPoint) -> None:
         """Show context menu for slate list items."""
-        item = self.list_slates.itemAt(position)
-        if not item:
+        index = self.list_slates.indexAt(position)
+        if not index.isValid():
             return
 
-        slate_name = str(item.data(Qt.ItemDataRole.UserRole))
+        slate_name = self._listed_keys[index.row()]
         slate_data = self.slates_dict.get(slate_name)
 
         if not slate_data:
@@ -1177,25 +1406,33 @@ class GalleryGeneratorApp(QMainWindow):
 
     def apply_filters_debounced(self) -> None:
         """Apply filters with performance monitoring and enhanced error handling."""
-        import time
-
-        start_time = time.perf_counter()
-
         try:
-            filter_text = str(self.txt_filter.text()).strip().lower()
+            if (self.txt_filter.text().strip(), self.txt_exclude.text().strip()) == self._applied_filter_texts:
+                return
+
+            filter_text = self.txt_filter.text().strip().lower()
             slate_count = len(self.slates_dict)
 
-            logger.debug(f"Applying filter '{filter_text}' to {slate_count} slates")
+            # Filtering small lists is far below the slow-filter threshold, so only time
+            # it for large lists or when debug logging wants the numbers
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            timer: Optional[QElapsedTimer] = None
+            if debug_enabled or slate_count > FILTER_TIMING_MIN_SLATES:
+                timer = QElapsedTimer()
+                timer.start()
+
+            if debug_enabled:
+                logger.debug(f"Applying filter '{filter_text}' to {slate_count} slates")
 
             # Apply the actual filtering
             self.apply_filters()
 
             # Performance metrics
-            end_time = time.perf_counter()
-            filter_time = (end_time - start_time) * 1000  # Convert to milliseconds
-            filtered_count = len(self.filtered_slates)
+            filter_time = timer.nsecsElapsed() / 1_000_000 if timer else 0.0  # Milliseconds
+            filtered_count = len(self._visible_keys)
 
-            logger.debug(f"Filter applied in {filter_time:.1f}ms: {filtered_count}/{slate_count} slates shown")
+            if debug_enabled:
+                logger.debug(f"Filter applied in {filter_time:.1f}ms: {filtered_count}/{slate_count} slates shown")
 
             # Provide user feedback for slow operations
             if filter_time > 100:  # If filtering takes more than 100ms
@@ -1212,67 +1449,89 @@ class GalleryGeneratorApp(QMainWindow):
             self.update_status(error_msg)
             logger.error(error_msg, exc_info=True)
 
-    @log_function
+    # apply_filters and populate_slates_list run on every filter change, so they skip
+    # @log_function and format their own log lines only when the level is enabled
     def apply_filters(self) -> None:
-        filter_text = str(self.txt_filter.text()).strip().lower()
-        exclude_pattern = str(self.txt_exclude.text()).strip()
+        raw_filter_text = self.txt_filter.text().strip()
+        exclude_pattern = self.txt_exclude.text().strip()
+        self._applied_filter_texts = (raw_filter_text, exclude_pattern)
+        filter_text = raw_filter_text.lower()
 
         # Save exclude pattern preference if it changed
         if exclude_pattern != self.exclude_patterns_pref:
             self.exclude_patterns_pref = exclude_pattern
-            self._sync_config_and_save()
+            self._schedule_config_save()
 
-        # Start with all slates
-        filtered = self.slates_dict.copy()
-
-        # Apply inclusion filter if text is present
-        if filter_text:
-            filtered = {
-                slate: data
-                for slate, data in filtered.items()
-                if filter_text in slate.lower()
-            }
-
-        # Apply exclusion filter if pattern is present
-        if exclude_pattern:
-            # Split by comma to support multiple patterns
-            exclude_patterns = [p.strip().lower() for p in exclude_pattern.split(',') if p.strip()]
-            filtered = {
-                slate: data
-                for slate, data in filtered.items()
-                if not any(pattern in slate.lower() for pattern in exclude_patterns)
-            }
-
-        self.filtered_slates = filtered
+        exclude_patterns = [p.strip().lower() for p in exclude_pattern.split(',') if p.strip()]
+
+        keys = self._slate_keys
+        if not filter_text and not exclude_patterns:
+            # Nothing to filter - show every scanned slate without copying
+            visible = keys
+        else:
+            pairs: Iterable[tuple[str, str]] = zip(keys, self._slate_keys_lower)
+
+            # Apply inclusion filter if text is present. Anything containing the new
+            # text also contains any substring of it, so when the previous filter text
+            # is contained in the new one only the previous matches need rescanning.
+            if filter_text:
+                last_text = self._last_filter_text
+                if last_text and last_text in filter_text:
+                    pairs = self._last_filter_pairs
+                pairs = [(slate, lower) for slate, lower in pairs if filter_text in lower]
+                self._last_filter_text = filter_text
+                self._last_filter_pairs = pairs
+
+            # Apply exclusion filter (comma-separated patterns) if present
+            if exclude_patterns:
+                pairs = [
+                    (slate, lower)
+                    for slate, lower in pairs
+                    if not any(pattern in lower for pattern in exclude_patterns)
+                ]
+
+            visible = [slate for slate, _ in pairs]
+
+        self._visible_keys = visible
         self.populate_slates_list()
-        logger.info(f"Filtered slates - filter: '{filter_text}', exclude: '{exclude_pattern}', result: {len(filtered)} slates")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Filtered slates - filter: '{filter_text}', exclude: '{exclude_pattern}', result: {len(visible)} slates")
 
-    @log_function
     def populate_slates_list(self) -> None:
-        # Save currently selected slate names before clearing (using stored data, not display text)
-        selected_names: set[str] = {
-            str(item.data(Qt.ItemDataRole.UserRole))  # pyright: ignore[reportAny]
-            for item in self.list_slates.selectedItems()
-        }
-
-        self.list_slates.clear()
-        for slate in sorted(self.filtered_slates.keys()):
-            # Get image count from slate data
-            slate_data = self.filtered_slates[slate]
-            image_count = len(slate_data["images"])
-
-            # Create item with HTML: bold name, regular count
-            item = QListWidgetItem(f"<b>{slate}</b> ({image_count})")
-            # Store original slate name for lookups
-            item.setData(Qt.ItemDataRole.UserRole, slate)
-            self.list_slates.addItem(item)
-
-            # Restore selection if this slate was previously selected
-            if slate in selected_names:
-                item.setSelected(True)
+        names = self._visible_keys
+        slates = self.slates_dict
+
+        # A filter edit that matches the same slates (e.g. another character of a name
+        # every match shares) leaves the rows, and so the selection, as they are
+        unchanged = slates is self._listed_slates and (names is self._listed_keys or names == self._listed_keys)
+
+        # Save currently selected slate names before clearing (by row, not display text)
+        selected_names = set(self._selected_slate_names()) if not unchanged else set()
+
+        if not unchanged:
+            # Replace every row with one model reset; display strings are rendered as
+            # bold name + regular image count by HtmlItemDelegate
+            self.slate_model.setStringList([f"<b>{slate}</b> ({len(slates[slate]['images'])})" for slate in names])
+            self._listed_keys = names
+            self._listed_slates = slates
+
+        # Restore selection for slates that were previously selected, merging adjacent
+        # rows into ranges and applying them with one select() (one selectionChanged)
+        rows = [row for row, slate in enumerate(names) if slate in selected_names] if selected_names else []
+        if rows:
+            model = self.slate_model
+            selection = QItemSelection()
+            range_start = prev_row = rows[0]
+            for row in rows[1:]:
+                if row != prev_row + 1:
+                    selection.select(model.index(range_start), model.index(prev_row))
+                    range_start = row
+                prev_row = row
+            selection.select(model.index(range_start), model.index(prev_row))
+            self.list_slates.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
 
         # Update filter count label
-        filtered_count = len(self.filtered_slates)
+        filtered_count = len(self._visible_keys)
         total_count = len(self.slates_dict)
         if filtered_count == total_count:
             self.lbl_filter_count.setText(f"Showing all {total_count} slates")
@@ -1280,13 +1539,17 @@ class GalleryGeneratorApp(QMainWindow):
             filtered_out = total_count - filtered_count
             self.lbl_filter_count.setText(f"Showing {filtered_count} of {total_count} slates ({filtered_out} filtered out)")
 
-        logger.debug(f"Populated slates list with {self.list_slates.count()} slates.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Populated slates list with {self.slate_model.rowCount()} slates.")
+
+    def _selected_slate_names(self) -> list[str]:
+        """Return the slate names of the selected rows in list_slates."""
+        listed = self._listed_keys
+        return [listed[index.row()] for index in self.list_slates.selectionModel().selectedIndexes()]
 
     def on_select_all(self) -> None:
         try:
-            for index in range(self.list_slates.count()):
-                item = self.list_slates.item(index)
-                item.setSelected(True)
+            self.list_slates.selectAll()
             logger.info("All slates selected.")
         except Exception as e:
             self.update_status(f"Error selecting all slates: {e}")
@@ -1339,10 +1602,10 @@ class GalleryGeneratorApp(QMainWindow):
             logger.info(f"Refreshing directories: {self.selected_slate_dirs}")
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
-            self.slates_dict = {}
-            self.filtered_slates = {}
-            self.unique_focal_lengths = set()
-            self.list_slates.clear()
+            self._set_slates({})
+            self._visible_keys = []
+            self.slate_model.setStringList([])
+            self._listed_keys = []
 
             # Disable scan/refresh buttons during scan
             self.btn_scan.setEnabled(False)
@@ -1366,20 +1629,16 @@ class GalleryGeneratorApp(QMainWindow):
                 logger.warning("Gallery generation already in progress, ignoring request")
                 return
 
-            selected_items = self.list_slates.selectedItems()
-            if not selected_items:
+            selected_slates = self._selected_slate_names()
+            if not selected_slates:
                 self.update_status("Please select at least one slate.")
                 logger.warning("Generate gallery initiated without selecting any slates.")
                 return
 
-            selected_slates = [
-                str(item.data(Qt.ItemDataRole.UserRole))  # pyright: ignore[reportAny]
-                for item in selected_items
-            ]
             output = self.output_dir
 
             if not output:
-                output = os.path.expanduser("~")
+                output = HOME_DIR
                 self.output_dir = output
                 self.update_status("Output directory set to home directory.")
                 logger.info(f"Output directory set to home directory: {self.output_dir}")
@@ -1421,7 +1680,8 @@ class GalleryGeneratorApp(QMainWindow):
                 template_path=template_path,
                 generate_thumbnails=self.chk_generate_thumbnails.isChecked(),
                 thumbnail_size=self.thumbnail_size,
-                lazy_loading=self.chk_lazy_loading.isChecked()
+                lazy_loading=self.chk_lazy_loading.isChecked(),
+                high_quality_thumbnails=self.chk_high_quality_thumbnails.isChecked(),
             )
             # Use QueuedConnection for thread-to-main-thread signals to prevent race conditions
             _ = self.gallery_thread.gallery_complete.connect(self.on_gallery_complete, Qt.ConnectionType.QueuedConnection)
@@ -1451,6 +1711,9 @@ class GalleryGeneratorApp(QMainWindow):
         logger.debug(f"Gallery generation progress: {progress_int}%")
 
     def on_open_gallery(self) -> None:
+        # Imported on first use; only needed when the user opens a gallery
+        import webbrowser
+
         try:
             html_file_path = os.path.join(self.output_dir, "index.html")
             if os.path.exists(html_file_path):
@@ -1478,7 +1741,8 @@ class GalleryGeneratorApp(QMainWindow):
         self.generate_thumbnails_pref = self.chk_generate_thumbnails.isChecked()
         # Enable/disable size dropdown based on checkbox state
         self.combo_thumbnail_size.setEnabled(self.generate_thumbnails_pref)
-        self._sync_config_and_save()
+        self.chk_high_quality_thumbnails.setEnabled(self.generate_thumbnails_pref)
+        self._schedule_config_save()
 
     def on_thumbnail_size_changed(self, text: object) -> None:
         """Save thumbnail size preference when dropdown changes."""
@@ -1489,17 +1753,23 @@ class GalleryGeneratorApp(QMainWindow):
                 size_str = text_str.split('x')[0].strip()
                 try:
                     self.thumbnail_size = int(size_str)
-                    self._sync_config_and_save()
+                    self._schedule_config_save()
                     logger.info(f"Thumbnail size changed to: {self.thumbnail_size}")
                 except ValueError:
                     logger.error(f"Invalid thumbnail size format: {text_str}")
             else:
                 logger.error(f"Invalid thumbnail size format (missing 'x'): {text_str}")
 
+    def on_high_quality_pref_changed(self) -> None:
+        """Save high quality thumbnail preference when checkbox state changes."""
+        self.high_quality_thumbnails_pref = self.chk_high_quality_thumbnails.isChecked()
+        self._schedule_config_save()
+        logger.info(f"High quality thumbnail preference changed to: {self.high_quality_thumbnails_pref}")
+
     def on_lazy_loading_pref_changed(self) -> None:
         """Save lazy loading preference when checkbox state changes."""
         self.lazy_loading_pref = self.chk_lazy_loading.isChecked()
-        self._sync_config_and_save()
+        self._schedule_config_save()
         logger.info(f"Lazy loading preference changed to: {self.lazy_loading_pref}")
 
     @override
@@ -1507,6 +1777,11 @@ class GalleryGeneratorApp(QMainWindow):
         try:
             # Disconnect signals before stopping threads to prevent race conditions
             # during shutdown where signals might be emitted to destroyed slots
+            if self.cache_load_thread:
+                # Signal may never have been connected or already disconnected
+                with contextlib.suppress(TypeError, RuntimeError):
+                    self.cache_load_thread.cache_loaded.disconnect(self.on_cache_loaded)
+
             if self.scan_thread:
                 try:
                     self.scan_thread.scan_complete.disconnect(self.on_scan_complete)
@@ -1537,14 +1812,19 @@ class GalleryGeneratorApp(QMainWindow):
             if self.gallery_thread and not self.gallery_thread.wait(5000):
                 logger.warning("Gallery thread did not stop within timeout")
 
-            # Stop filter timer
-            self.filter_timer.stop()
+            # Cache loading cannot be interrupted; it only reads files, so just wait
+            if self.cache_load_thread and not self.cache_load_thread.wait(5000):
+                logger.warning("Cache load thread did not finish within timeout")
+
+            # Drop any pending trailing filter pass
+            self.filter_throttler.cancel()
 
             # Ensure clean shutdown
             self.cache_manager.shutdown()
             logger.info("Cache manager shutdown successfully.")
 
-            # Save configuration
+            # Save configuration (also flushes any pending coalesced save)
+            self.config_save_timer.stop()
             self._sync_config_and_save()
 
             event.accept()  # type: ignore[union-attr]
@@ -1557,54 +1837,52 @@ class GalleryGeneratorApp(QMainWindow):
 # ----------------------------- Main Execution -----------------------------
 
 
+def _log_uncaught_exception(
+    exc_type: type[BaseException], exc_value: BaseException, exc_tb: Optional[TracebackType]
+) -> None:
+    """Route uncaught exceptions (top level and Qt slots) through the app logger."""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_tb)
+        return
+    logger.critical(f"Uncaught exception: {exc_value}", exc_info=(exc_type, exc_value, exc_tb))
+
+
 def main() -> None:
-    try:
-        app = QApplication(sys.argv)
-
-        # Set application-wide stylesheet for dialogs
-        app.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {COLOR_SURFACE};
-            }}
-            QMessageBox QLabel {{
-                color: {COLOR_TEXT_PRIMARY};
-            }}
-            QMessageBox QPushButton {{
-                background-color: {COLOR_SECONDARY};
-                color: {COLOR_PRIMARY};
-                border: none;
-                padding: {SPACING_SM}px {SPACING_MD}px;
-                border-radius: 6px;
-                min-width: 80px;
-                font-weight: 500;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: {COLOR_SECONDARY_HOVER};
-            }}
-            QFileDialog {{
-                background-color: {COLOR_SURFACE};
-            }}
-            QFileDialog QTreeView {{
-                background-color: {COLOR_SURFACE};
-                border: 2px solid {COLOR_BORDER};
-                border-radius: 6px;
-            }}
-            QFileDialog QTreeView::item:selected {{
-                background-color: {COLOR_SECONDARY};
-                color: {COLOR_PRIMARY};
-            }}
-            QFileDialog QTreeView::item:hover {{
-                background-color: {COLOR_BACKGROUND};
-            }}
-        """)
-
-        window = GalleryGeneratorApp()
-        window.show()
-        logger.info("Application started successfully.")
-        sys.exit(app.exec())
-    except Exception as e:
-        logger.critical(f"Critical error in main execution: {e}", exc_info=True)
-        sys.exit(1)
+    # Dump native tracebacks on hard crashes inside Qt (no stderr under pythonw)
+    if sys.stderr is not None:
+        faulthandler.enable()
+    sys.excepthook = _log_uncaught_exception
+
+    # Keep Qt's internal debug categories quiet during startup (plugin probing etc.);
+    # QT_LOGGING_RULES in the environment still takes precedence when debugging Qt
+    QLoggingCategory.setFilterRules("qt.*.debug=false")
+
+    # Coalesce mouse-move/wheel/resize bursts on every platform (not only where the
+    # platform plugin turns it on) and keep native window handles to the widgets that need them
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
+
+    # Every color comes from the light stylesheets, so skip reading the desktop theme's
+    # palette and fonts (GTK/KDE settings probing); this also keeps a dark system
+    # palette from leaking into partially styled dialogs
+    QApplication.setDesktopSettingsAware(False)
+
+    # The app takes no command-line options, so hand Qt only the program name and skip
+    # its switch parsing; QT_QPA_PLATFORM / QT_STYLE_OVERRIDE still work for overrides
+    app = QApplication(sys.argv[:1])
+
+    # Set application-wide stylesheet for dialogs
+    app.setStyleSheet(APP_STYLESHEET)
+
+    window = GalleryGeneratorApp()
+    window.show()
+    logger.info("Application started successfully.")
+    exit_code = app.exec()
+
+    # Tear the window's QObject tree down now, while QApplication still exists,
+    # instead of leaving it to the interpreter's finalization and cyclic GC
+    del window
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
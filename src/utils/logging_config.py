@@ -94,12 +94,16 @@ def log_function(func: Callable[P, R]) -> Callable[P, R]:
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         ensure_handlers_initialized()  # Lazy initialization on first use
-        logger.debug(f"Entering function: {func.__name__}")
+        # Skip building the trace messages entirely unless DEBUG is enabled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Entering function: {func.__name__}")
         # Avoid logging arguments during intensive tasks
         # logger.debug("Arguments: args={}, kwargs={}".format(args, kwargs))
         try:
             result: R = func(*args, **kwargs)
-            logger.debug(f"Exiting function: {func.__name__}")
+            if debug_enabled:
+                logger.debug(f"Exiting function: {func.__name__}")
             # logger.debug("Return value: {}".format(result))
             return result
         except Exception as e:
@@ -15,6 +15,7 @@ from typing_extensions import override
 
 from type_defs import (
     CachedImageInfo,
+    CacheMetadata,
     DateData,
     ExifData,
     FocalLengthData,
@@ -45,10 +46,16 @@ class CacheManagerProtocol(Protocol):
     ) -> list[CachedImageInfo]:
         ...
 
-    def save_cache(self, root_dir: str, slates: ProcessedResults) -> None:
+    def load_cache_with_metadata(self, root_dir: str) -> tuple[Optional[ProcessedResults], Optional[CacheMetadata]]:
         ...
 
-    def save_composite_cache(self, root_dirs: list[str], slates: ProcessedResults) -> None:
+    def validate_metadata(self, root_dir: str, metadata: Optional[CacheMetadata]) -> bool:
+        ...
+
+    def save_cache(self, root_dir: str, slates: ProcessedResults) -> Optional[CacheMetadata]:
+        ...
+
+    def save_composite_cache(self, root_dirs: list[str], slates: ProcessedResults) -> Optional[CacheMetadata]:
         ...
 
 
@@ -190,6 +197,33 @@ def _scan_single_root_dir(root_dir: str, exclude_patterns: str) -> dict[str, dic
     return prefixed_slates
 
 
+class CacheLoadThread(QtCore.QThread):
+    """Load and validate a directory's slate cache off the GUI thread.
+
+    Emits cache_loaded(slates, metadata, is_valid) once; slates is empty and
+    metadata None when no cache exists or it could not be read. The cache file is
+    parsed once: validity is checked from the metadata that came with the slates.
+    """
+
+    cache_loaded: Signal = Signal(dict, object, bool)  # type: ignore[misc]
+
+    def __init__(self, root_dir: str, cache_manager: CacheManagerProtocol) -> None:
+        super().__init__()
+        self.root_dir: str = root_dir
+        self.cache_manager: CacheManagerProtocol = cache_manager
+
+    @log_function
+    @override
+    def run(self) -> None:
+        try:
+            slates, metadata = self.cache_manager.load_cache_with_metadata(self.root_dir)
+            is_valid = self.cache_manager.validate_metadata(self.root_dir, metadata) if slates else False
+            self.cache_loaded.emit(slates or {}, metadata if slates else None, is_valid)
+        except Exception as e:
+            logger.error(f"Error loading cache for {self.root_dir}: {e}", exc_info=True)
+            self.cache_loaded.emit({}, None, False)
+
+
 class ScanThread(QtCore.QThread):
     scan_complete: Signal = Signal(dict, str)  # type: ignore[misc]
     progress: Signal = Signal(int)  # type: ignore[misc]
@@ -210,6 +244,9 @@ class ScanThread(QtCore.QThread):
             self.root_dirs = [str(d) for d in root_dirs]
         self.cache_manager: CacheManagerProtocol = cache_manager
         self.exclude_patterns: str = exclude_patterns
+        # Metadata written with the scanned slates, for validating them later without
+        # reading the cache file back; None until saved or if saving failed
+        self.cache_metadata: Optional[CacheMetadata] = None
         self._stop_event: threading.Event = threading.Event()
 
     def signal_stop(self) -> None:
@@ -407,9 +444,9 @@ class ScanThread(QtCore.QThread):
             slates: Processed results to save
         """
         if len(self.root_dirs) == 1:
-            self.cache_manager.save_cache(self.root_dirs[0], slates)
+            self.cache_metadata = self.cache_manager.save_cache(self.root_dirs[0], slates)
         else:
-            self.cache_manager.save_composite_cache(self.root_dirs, slates)
+            self.cache_metadata = self.cache_manager.save_composite_cache(self.root_dirs, slates)
 
 
 class GenerateGalleryThread(QtCore.QThread):
@@ -426,7 +463,8 @@ class GenerateGalleryThread(QtCore.QThread):
         template_path: str,
         generate_thumbnails: bool,
         thumbnail_size: int = 600,
-        lazy_loading: bool = True
+        lazy_loading: bool = True,
+        high_quality_thumbnails: bool = False,
     ) -> None:
         """Initialize gallery generation thread.
 
@@ -440,6 +478,7 @@ class GenerateGalleryThread(QtCore.QThread):
             generate_thumbnails: Whether to generate thumbnails
             thumbnail_size: Size of thumbnails (600, 800, or 1200)
             lazy_loading: Whether to enable lazy loading
+            high_quality_thumbnails: Resample thumbnails with LANCZOS instead of BICUBIC
         """
         super().__init__()
         self.selected_slates: list[str] = selected_slates
@@ -451,6 +490,7 @@ class GenerateGalleryThread(QtCore.QThread):
         self.generate_thumbnails: bool = generate_thumbnails
         self.thumbnail_size: int = thumbnail_size
         self.lazy_loading: bool = lazy_loading
+        self.high_quality_thumbnails: bool = high_quality_thumbnails
         self._stop_event: threading.Event = threading.Event()
 
         # Lock for thread-safe operations
@@ -844,7 +884,11 @@ class GenerateGalleryThread(QtCore.QThread):
                     with contextlib.suppress(ValueError, TypeError):
                         exif_orientation_int = int(str(exif_orientation))
                 thumbnails = generate_thumbnail(
-                    image_path, self.thumb_dir, size=self.thumbnail_size, orientation=exif_orientation_int
+                    image_path,
+                    self.thumb_dir,
+                    size=self.thumbnail_size,
+                    orientation=exif_orientation_int,
+                    high_quality=self.high_quality_thumbnails,
                 )
                 logger.debug(f"Generated {len(thumbnails)} thumbnails for {filename}")
                 # Get the single thumbnail path
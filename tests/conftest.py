@@ -36,6 +36,26 @@ def test_data_dir():
         yield test_dir
 
 
+@pytest.fixture(autouse=True)
+def isolated_template_cache(tmp_path, monkeypatch):
+    """Keep compiled Jinja2 templates out of the real ~/.slate_gallery cache.
+
+    Every test template would otherwise leave its own bytecode file behind. The
+    generator is imported both as src.core.gallery_generator (by tests) and as
+    core.gallery_generator (by GenerateGalleryThread), so both modules are patched.
+    """
+    import importlib
+
+    cache_dir = tmp_path / "template_cache"
+    for module_name in ("src.core.gallery_generator", "core.gallery_generator"):
+        module = importlib.import_module(module_name)
+        monkeypatch.setattr(module, "TEMPLATE_CACHE_DIR", str(cache_dir))
+        monkeypatch.setattr(module, "_bytecode_cache", None)
+        monkeypatch.setattr(module, "_bytecode_cache_checked", False)
+        monkeypatch.setattr(module, "_environments", {})
+    return cache_dir
+
+
 @pytest.fixture
 def thread_cleanup(qtbot):  # type: ignore[no-untyped-def]
     """Register Qt threads for automatic cleanup after test.
@@ -120,6 +120,41 @@ class TestImprovedCacheManager:
         loaded_slates = cache_manager.load_cache(root_dir)
         assert loaded_slates is None
 
+    def test_load_cache_with_metadata_validates_without_rereading(self, cache_manager, monkeypatch):
+        """Test that load_cache_with_metadata returns what validate_metadata needs."""
+        with tempfile.TemporaryDirectory() as root_dir:
+            test_slates = {"slate1": {"images": []}}
+            saved_metadata = cache_manager.save_cache(root_dir, test_slates)
+
+            reads = []
+            original_read = cache_manager._read_cache_data
+            monkeypatch.setattr(
+                cache_manager, "_read_cache_data", lambda f: (reads.append(f), original_read(f))[1]
+            )
+
+            slates, metadata = cache_manager.load_cache_with_metadata(root_dir)
+
+            assert slates == test_slates
+            assert metadata == saved_metadata
+            assert cache_manager.validate_metadata(root_dir, metadata) is True
+            assert len(reads) == 1
+
+    def test_validate_metadata_detects_new_images(self, cache_manager):
+        """Test that validate_metadata reports a changed image count as stale."""
+        with tempfile.TemporaryDirectory() as root_dir:
+            metadata = cache_manager.save_cache(root_dir, {"slate1": {"images": []}})
+            with open(os.path.join(root_dir, "new.jpg"), "wb") as f:
+                f.write(b"\xff\xd8")
+            # Keep the directory mtime from deciding, so the count check is what fails
+            metadata["dir_mtime"] = os.path.getmtime(root_dir)
+
+            assert cache_manager.validate_metadata(root_dir, metadata) is False
+
+    def test_validate_metadata_without_metadata(self, cache_manager):
+        """Test that old-format caches without metadata are never valid."""
+        with tempfile.TemporaryDirectory() as root_dir:
+            assert cache_manager.validate_metadata(root_dir, None) is False
+
     def test_process_images_batch(self, cache_manager):
         """Test process_images_batch returns expected format."""
         image_paths = ["/path/to/image1.jpg", "/path/to/image2.jpg"]
@@ -377,6 +412,22 @@ class TestCompositeCacheOperations:
         # Should count only valid images
         assert data["_metadata"]["file_count"] == 1
 
+    def test_save_composite_cache_max_mtime_skips_missing_dirs(self, temp_cache_dir, temp_image_dirs):
+        """dir_mtime is the newest mtime of the existing directories only."""
+        import json
+
+        cache_manager = ImprovedCacheManager(base_dir=temp_cache_dir)
+        os.utime(temp_image_dirs[0], (1000, 1000))
+        os.utime(temp_image_dirs[1], (2000, 2000))
+        dirs = [temp_image_dirs[0], temp_image_dirs[1], "/nonexistent/slate_dir"]
+
+        cache_manager.save_composite_cache(dirs, {"slate": {"images": []}})
+
+        with open(cache_manager.get_composite_cache_file(dirs)) as f:
+            data = json.load(f)
+
+        assert data["_metadata"]["dir_mtime"] == 2000
+
     # === load_composite_cache tests ===
 
     def test_load_composite_cache_success(self, temp_cache_dir):
@@ -511,6 +562,20 @@ class TestCompositeCacheOperations:
             is_valid = cache_manager.validate_composite_cache(dirs2)
             assert is_valid is True
 
+    def test_load_composite_cache_with_metadata(self, temp_cache_dir, temp_image_dirs):
+        """Loaded composite metadata validates without reading the file again."""
+        cache_manager = ImprovedCacheManager(base_dir=temp_cache_dir)
+        dirs = temp_image_dirs[:2]
+        slates = {"slate": {"images": []}}
+        saved_metadata = cache_manager.save_composite_cache(dirs, slates)
+
+        loaded, metadata = cache_manager.load_composite_cache_with_metadata(dirs)
+
+        assert loaded == slates
+        assert metadata == saved_metadata
+        assert cache_manager.validate_composite_metadata(dirs, metadata) is True
+        assert cache_manager.validate_composite_metadata(dirs[:1], metadata) is False
+
     # === Integration / roundtrip tests ===
 
     def test_composite_cache_roundtrip(self, temp_cache_dir):
@@ -51,6 +51,7 @@ class TestConfigManagerImproved:
             selected_slate_dirs=["/test/dir1", "/test/dir2", "/test/dir3"],
             generate_thumbnails=True,
             thumbnail_size=800,
+            high_quality_thumbnails=True,
             lazy_loading=False,
             exclude_patterns=""
         )
@@ -69,6 +70,7 @@ class TestConfigManagerImproved:
         assert loaded_config.slate_dirs == test_config.slate_dirs
         assert loaded_config.generate_thumbnails == test_config.generate_thumbnails
         assert loaded_config.thumbnail_size == test_config.thumbnail_size
+        assert loaded_config.high_quality_thumbnails is True
         assert loaded_config.lazy_loading == test_config.lazy_loading
 
     def test_save_config_empty_values(self, setup_config_env):
@@ -220,6 +222,69 @@ class TestConfigManagerImproved:
         assert config.current_slate_dir.startswith("/thread_")
         assert len(config.slate_dirs) == 1
 
+    def test_cached_load_returns_independent_copies(self, setup_config_env):
+        """Mutating a loaded config must not leak into later loads."""
+        save_config(GalleryConfig(current_slate_dir="/a", slate_dirs=["/a"], selected_slate_dirs=["/a"]))
+
+        first = load_config()
+        first.slate_dirs.append("/mutated")
+        first.current_slate_dir = "/mutated"
+
+        second = load_config()
+        assert second.current_slate_dir == "/a"
+        assert second.slate_dirs == ["/a"]
+
+    def test_load_config_picks_up_external_edits(self, setup_config_env):
+        """Editing the file outside save_config invalidates the cached parse."""
+        save_config(GalleryConfig(current_slate_dir="/before"))
+        assert load_config().current_slate_dir == "/before"
+
+        setup_config_env.write_text("[Settings]\ncurrent_slate_dir = /after/edited/by/hand\n")
+
+        assert load_config().current_slate_dir == "/after/edited/by/hand"
+
+    def test_selected_dirs_default_follows_current_dir_existence(self, setup_config_env, tmp_path):
+        """The current_slate_dir fallback is re-checked on every load, not cached."""
+        current = tmp_path / 'appears_later'
+        setup_config_env.write_text(f"[Settings]\ncurrent_slate_dir = {current}\n")
+
+        assert load_config().selected_slate_dirs == []
+
+        current.mkdir()
+        assert load_config().selected_slate_dirs == [str(current)]
+
+        current.rmdir()
+        assert load_config().selected_slate_dirs == []
+
+    def test_save_config_is_atomic_and_configparser_compatible(self, setup_config_env):
+        """Saving leaves no temp files behind and still writes a standard INI file."""
+        import configparser
+
+        save_config(GalleryConfig(current_slate_dir="/a", slate_dirs=["/a", "/b"], thumbnail_size=800))
+
+        assert [p.name for p in setup_config_env.parent.iterdir()] == ["config.ini"]
+        parser = configparser.ConfigParser()
+        parser.read(setup_config_env, encoding="utf-8")
+        assert parser.get("Settings", "current_slate_dir") == "/a"
+        assert parser.get("Settings", "slate_dirs") == '["/a", "/b"]'
+        assert parser.getint("Settings", "thumbnail_size") == 800
+        assert parser.getboolean("Settings", "lazy_loading") is True
+
+    def test_save_config_keeps_mode_and_symlink(self, setup_config_env, tmp_path):
+        """Saving through a symlinked config updates the target and keeps its mode."""
+        target = tmp_path / 'dotfiles' / 'config.ini'
+        target.parent.mkdir()
+        target.write_text("[Settings]\n")
+        target.chmod(0o644)
+        setup_config_env.symlink_to(target)
+
+        save_config(GalleryConfig(current_slate_dir="/linked"))
+
+        assert setup_config_env.is_symlink()
+        assert os.stat(target).st_mode & 0o777 == 0o644
+        assert "current_slate_dir = /linked" in target.read_text()
+        assert load_config().current_slate_dir == "/linked"
+
 
 class TestConfigManagerEdgeCases:
     """Test edge cases with real file operations."""
@@ -279,6 +344,42 @@ class TestConfigManagerEdgeCases:
         content = config_file.read_text()
         assert "[Settings]" in content
 
+    def test_config_partial_settings_keeps_defaults(self, tmp_path, monkeypatch):
+        """Missing keys fall back to defaults while present keys are still loaded."""
+        config_file = tmp_path / 'partial.ini'
+        config_file.write_text("[Settings]\ngenerate_thumbnails = yes\nthumbnail_size = 1200\n")
+
+        monkeypatch.setattr('src.core.config_manager.CONFIG_FILE', str(config_file))
+
+        config = load_config()
+
+        assert config.generate_thumbnails is True
+        assert config.thumbnail_size == 1200
+        assert config.current_slate_dir == ""
+        assert config.slate_dirs == []
+        assert config.lazy_loading is True
+        assert config.exclude_patterns == ""
+
+    def test_config_reader_ignores_comments_and_other_sections(self, tmp_path, monkeypatch):
+        """Only [Settings] keys are read; comments and foreign sections are skipped."""
+        config_file = tmp_path / 'commented.ini'
+        config_file.write_text(
+            "# leading comment\n"
+            "[Other]\n"
+            "current_slate_dir = /wrong\n"
+            "[Settings]\n"
+            "; another comment\n"
+            "Current_Slate_Dir = /right = still/part/of/value\n"
+            "exclude_patterns =\n"
+        )
+
+        monkeypatch.setattr('src.core.config_manager.CONFIG_FILE', str(config_file))
+
+        config = load_config()
+
+        assert config.current_slate_dir == "/right = still/part/of/value"
+        assert config.exclude_patterns == ""
+
 
 class TestConfigManagerJSONSerialization:
     """Test JSON serialization for list values to handle pipe characters in paths."""
@@ -1,5 +1,6 @@
 """Improved gallery generator tests using real callbacks instead of mocks."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -337,6 +338,57 @@ class TestGenerateHtmlGalleryImproved:
         output_file = Path(gallery_setup['output_dir']) / 'index.html'
         assert output_file.exists()
 
+    def test_render_error_keeps_previous_gallery(self, gallery_setup, status_collector):
+        """A template that fails mid-render must not clobber an existing index.html."""
+        output_dir = Path(gallery_setup['output_dir'])
+        output_dir.mkdir()
+        existing = output_dir / 'index.html'
+        existing.write_text("previous gallery")
+
+        bad_template = Path(gallery_setup['template_path']).parent / "bad.html"
+        bad_template.write_text("start {{ gallery[0].missing.attribute }} end")
+
+        success = generate_html_gallery(
+            gallery_data=[{'slate': 's', 'images': []}],
+            focal_length_data=[],
+            date_data=[],
+            template_path=str(bad_template),
+            output_dir=str(output_dir),
+            allowed_root_dirs=gallery_setup['root_dir'],
+            status_callback=status_collector
+        )
+
+        assert success[0] is False
+        assert status_collector.has_message("Error rendering template")
+        assert existing.read_text() == "previous gallery"
+        assert list(output_dir.glob('*.tmp')) == []
+
+    def test_write_uses_unique_temp_file_and_keeps_mode(self, gallery_setup, sample_gallery_data, status_collector):
+        """Another writer's temp file is left alone and index.html keeps its mode."""
+        output_dir = Path(gallery_setup['output_dir'])
+        output_dir.mkdir()
+        existing = output_dir / 'index.html'
+        existing.write_text("previous gallery")
+        existing.chmod(0o644)
+        other_writer = output_dir / 'index.html.tmp'
+        other_writer.write_text("half-written by another instance")
+
+        success = generate_html_gallery(
+            gallery_data=sample_gallery_data,
+            focal_length_data=[],
+            date_data=[],
+            template_path=gallery_setup['template_path'],
+            output_dir=str(output_dir),
+            allowed_root_dirs=gallery_setup['root_dir'],
+            status_callback=status_collector
+        )
+
+        assert success[0] is True
+        assert existing.read_text() != "previous gallery"
+        assert os.stat(existing).st_mode & 0o777 == 0o644
+        assert other_writer.read_text() == "half-written by another instance"
+        assert sorted(p.name for p in output_dir.iterdir()) == ['index.html', 'index.html.tmp']
+
 
 class TestGalleryGeneratorIntegration:
     """Integration tests with real file system operations."""
@@ -406,3 +458,284 @@ class TestGalleryGeneratorIntegration:
         content = output_file.read_text()
         assert 'Total slates: 5' in content
         assert '20 images' in content
+
+
+class TestAllowedRootValidation:
+    """Security validation of image paths against the allowed roots."""
+
+    @pytest.fixture
+    def template_path(self, tmp_path):
+        """Minimal template listing every rendered image path."""
+        template_file = tmp_path / "template.html"
+        template_file.write_text(
+            "{% for slate in gallery %}{% for image in slate.images %}"
+            "{{ image.web_path }}\n{% endfor %}{% endfor %}"
+        )
+        return str(template_file)
+
+    def _gallery(self, *paths):
+        return [{
+            'slate': 'slate',
+            'images': [{'original_path': str(p), 'filename': Path(p).name} for p in paths],
+        }]
+
+    def test_sibling_directory_with_common_prefix_is_rejected(self, tmp_path, template_path):
+        """An allowed root of /x/photos must not admit /x/photos_private."""
+        allowed = tmp_path / "photos"
+        sibling = tmp_path / "photos_private"
+        allowed.mkdir()
+        sibling.mkdir()
+        (allowed / "ok.jpg").write_bytes(b"x")
+        (sibling / "secret.jpg").write_bytes(b"x")
+
+        gallery_data = self._gallery(allowed / "ok.jpg", sibling / "secret.jpg")
+        success, skipped = generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), StatusCollector()
+        )
+
+        assert success is True
+        assert skipped == 1
+        assert [img['filename'] for img in gallery_data[0]['images']] == ['ok.jpg']
+
+    def test_symlinked_file_pointing_outside_root_is_rejected(self, tmp_path, template_path):
+        """A symlinked image escaping the root is caught even when its directory is allowed."""
+        allowed = tmp_path / "photos"
+        outside = tmp_path / "outside"
+        allowed.mkdir()
+        outside.mkdir()
+        (allowed / "ok.jpg").write_bytes(b"x")
+        (outside / "secret.jpg").write_bytes(b"x")
+        link = allowed / "link.jpg"
+        try:
+            link.symlink_to(outside / "secret.jpg")
+        except OSError:
+            pytest.skip("Symlinks not supported")
+
+        gallery_data = self._gallery(allowed / "ok.jpg", link)
+        _success, skipped = generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), StatusCollector()
+        )
+
+        assert skipped == 1
+        assert [img['filename'] for img in gallery_data[0]['images']] == ['ok.jpg']
+
+    def test_parent_reference_escaping_root_is_rejected(self, tmp_path, template_path):
+        """A path whose last component is '..' is resolved fully, not via its parent."""
+        allowed = tmp_path / "photos"
+        (allowed / "sub").mkdir(parents=True)
+
+        gallery_data = self._gallery(os.path.join(str(allowed), ".."))
+        _success, skipped = generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), StatusCollector()
+        )
+
+        assert skipped == 1
+        assert gallery_data[0]['images'] == []
+
+    def test_many_slates_validated_in_parallel_keep_order(self, tmp_path, template_path):
+        """The threaded path filters every slate and reports skips in slate order."""
+        allowed = tmp_path / "photos"
+        outside = tmp_path / "outside"
+        allowed.mkdir()
+        outside.mkdir()
+
+        gallery_data = []
+        for i in range(8):
+            ok = allowed / f"ok_{i}.jpg"
+            bad = outside / f"bad_{i}.jpg"
+            ok.write_bytes(b"x")
+            bad.write_bytes(b"x")
+            gallery_data.append({
+                'slate': f'slate_{i}',
+                'images': [
+                    {'original_path': str(ok), 'filename': ok.name},
+                    {'original_path': str(bad), 'filename': bad.name},
+                ],
+            })
+
+        collector = StatusCollector()
+        success, skipped = generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), collector
+        )
+
+        assert success is True
+        assert skipped == 8
+        assert [[img['filename'] for img in s['images']] for s in gallery_data] == [
+            [f"ok_{i}.jpg"] for i in range(8)
+        ]
+        skip_messages = [m for m in collector.messages if m.startswith("Skipping image")]
+        assert skip_messages == [
+            f"Skipping image outside of allowed directories: {outside / f'bad_{i}.jpg'}"
+            for i in range(8)
+        ]
+
+    def test_lexical_mode_skips_symlink_resolution(self, tmp_path, template_path, monkeypatch):
+        """With strict checking disabled, paths are compared lexically without realpath."""
+        monkeypatch.setattr('src.core.gallery_generator.STRICT_SYMLINK_CHECK', False)
+        monkeypatch.setattr(os.path, 'realpath', lambda *a, **k: pytest.fail("realpath called"))
+        allowed = tmp_path / "photos"
+        outside = tmp_path / "outside"
+
+        gallery_data = self._gallery(
+            allowed / "sub" / "ok.jpg",
+            allowed / "sub" / ".." / ".." / "outside" / "bad.jpg",
+            outside / "bad2.jpg",
+        )
+        _success, skipped = generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), StatusCollector()
+        )
+
+        assert skipped == 2
+        assert [img['filename'] for img in gallery_data[0]['images']] == ['ok.jpg']
+
+    def test_nested_allowed_roots(self, tmp_path, template_path):
+        """Images under either of two nested roots are accepted."""
+        outer = tmp_path / "outer"
+        inner = outer / "inner"
+        inner.mkdir(parents=True)
+        (outer / "a.jpg").write_bytes(b"x")
+        (inner / "b.jpg").write_bytes(b"x")
+
+        gallery_data = self._gallery(outer / "a.jpg", inner / "b.jpg")
+        _success, skipped = generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            [str(inner), str(outer)], StatusCollector()
+        )
+
+        assert skipped == 0
+        assert len(gallery_data[0]['images']) == 2
+
+    def test_realpath_called_once_per_root_and_directory(self, tmp_path, template_path, monkeypatch):
+        """Roots and image directories are resolved once each, not once per image."""
+        allowed = tmp_path / "photos"
+        allowed.mkdir()
+        images = []
+        for i in range(10):
+            image = allowed / f"img_{i}.jpg"
+            image.write_bytes(b"x")
+            images.append(image)
+
+        real_realpath = os.path.realpath
+        calls = []
+
+        def counting_realpath(path, *args, **kwargs):
+            calls.append(path)
+            return real_realpath(path, *args, **kwargs)
+
+        monkeypatch.setattr(os.path, 'realpath', counting_realpath)
+
+        _success, skipped = generate_html_gallery(
+            self._gallery(*images), [], [], template_path, str(tmp_path / "out"),
+            [str(allowed), str(allowed)], StatusCollector()
+        )
+
+        assert skipped == 0
+        # One call for the (duplicated) root, one for the shared image directory
+        assert len(calls) == 2
+
+    @pytest.mark.skipif(os.sep == "\\", reason="Backslash is a path separator on Windows")
+    def test_backslash_in_posix_filename_is_preserved(self, tmp_path, template_path):
+        """On POSIX a backslash is part of the filename, not a separator to rewrite."""
+        allowed = tmp_path / "photos"
+        allowed.mkdir()
+        image = allowed / "odd\\name.jpg"
+        image.write_bytes(b"x")
+
+        gallery_data = self._gallery(image)
+        generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), StatusCollector()
+        )
+
+        assert gallery_data[0]['images'][0]['web_path'] == "file://" + str(image)
+
+    def test_relative_image_path_gets_absolute_web_path(self, tmp_path, template_path, monkeypatch):
+        """Relative paths are still made absolute; absolute ones pass through unchanged."""
+        allowed = tmp_path / "photos"
+        allowed.mkdir()
+        absolute_image = allowed / "abs.jpg"
+        monkeypatch.chdir(tmp_path)
+
+        gallery_data = self._gallery(os.path.join("photos", "rel.jpg"), absolute_image)
+        generate_html_gallery(
+            gallery_data, [], [], template_path, str(tmp_path / "out"),
+            str(allowed), StatusCollector()
+        )
+
+        web_paths = [img['web_path'] for img in gallery_data[0]['images']]
+        assert web_paths == [
+            "file://" + str(allowed / "rel.jpg"),
+            "file://" + str(absolute_image),
+        ]
+
+
+class TestTemplateBytecodeCache:
+    """On-disk Jinja2 bytecode cache for the gallery template."""
+
+    @pytest.fixture
+    def fresh_cache_state(self, isolated_template_cache):
+        """Temp bytecode cache dir with fresh lazy state (set up by conftest)."""
+        return isolated_template_cache
+
+    def test_compiled_template_is_persisted(self, tmp_path, fresh_cache_state):
+        """Generating a gallery writes the compiled template to the cache dir."""
+        template_file = tmp_path / "template.html"
+        template_file.write_text("{{ gallery|length }} slates")
+
+        success = generate_html_gallery(
+            [], [], [], str(template_file), str(tmp_path / "out"),
+            str(tmp_path), StatusCollector()
+        )
+
+        assert success[0] is True
+        assert list(fresh_cache_state.glob("__jinja2_*.cache"))
+
+    def test_unusable_cache_dir_falls_back_to_no_cache(self, tmp_path, fresh_cache_state):
+        """A cache path that cannot be created must not break generation."""
+        fresh_cache_state.parent.mkdir(exist_ok=True)
+        fresh_cache_state.write_text("a file, not a directory")
+        template_file = tmp_path / "template.html"
+        template_file.write_text("ok")
+
+        success = generate_html_gallery(
+            [], [], [], str(template_file), str(tmp_path / "out"),
+            str(tmp_path), StatusCollector()
+        )
+
+        assert success[0] is True
+        assert (tmp_path / "out" / "index.html").read_text() == "ok"
+
+
+class TestTemplateEnvironmentCache:
+    """Reuse of the Jinja2 Environment across generate_html_gallery calls."""
+
+    def test_environment_reused_and_template_edits_picked_up(self, tmp_path, monkeypatch):
+        """The same Environment serves repeated runs but still sees template edits."""
+        import src.core.gallery_generator as gallery_generator
+
+        monkeypatch.setattr(gallery_generator, '_environments', {})
+        template_file = tmp_path / "template.html"
+        template_file.write_text("first")
+        output_file = tmp_path / "out" / "index.html"
+
+        def generate():
+            return generate_html_gallery(
+                [], [], [], str(template_file), str(tmp_path / "out"),
+                str(tmp_path), StatusCollector()
+            )
+
+        assert generate()[0] is True
+        assert output_file.read_text() == "first"
+        env = gallery_generator._environments[str(tmp_path)]
+
+        template_file.write_text("second")
+        os.utime(template_file, (template_file.stat().st_atime, template_file.stat().st_mtime + 5))
+
+        assert generate()[0] is True
+        assert output_file.read_text() == "second"
+        assert gallery_generator._environments[str(tmp_path)] is env
@@ -13,6 +13,7 @@ from src.core.image_processor import (
     get_exif_data,
     get_image_date,
     get_orientation,
+    iter_scan_directories,
     scan_directories,
 )
 
@@ -108,6 +109,50 @@ class TestGetExifData:
         result = get_exif_data('/some/path.jpg')
         assert result == {}
 
+    @pytest.mark.parametrize("writer", ["pillow", "piexif"])
+    def test_get_exif_data_jpeg_fast_path_matches_pillow(self, temp_image_dir, writer):
+        """The APP1 fast path returns the same tags and values as the Pillow path."""
+        image_path = temp_image_dir / f'exif_{writer}.jpg'
+        if writer == "pillow":
+            # Pillow writes little-endian ("II") TIFF headers
+            from PIL.TiffImagePlugin import IFDRational
+            exif = Image.Exif()
+            exif[ExifTags.Base.Orientation.value] = 6
+            exif[ExifTags.Base.DateTime.value] = '2024:01:02 03:04:05'
+            exif[ExifTags.Base.Make.value] = 'Camera'
+            exif_ifd = exif.get_ifd(ExifTags.IFD.Exif)
+            exif_ifd[ExifTags.Base.DateTimeOriginal.value] = '2023:12:31 23:59:58'
+            exif_ifd[ExifTags.Base.FocalLength.value] = IFDRational(35, 2)
+            exif_bytes = exif.tobytes()
+        else:
+            # piexif writes big-endian ("MM") TIFF headers
+            piexif = pytest.importorskip("piexif")
+            exif_bytes = piexif.dump({
+                "0th": {piexif.ImageIFD.Orientation: 3, piexif.ImageIFD.DateTime: b'2024:05:06 07:08:09'},
+                "Exif": {
+                    piexif.ExifIFD.DateTimeDigitized: b'2024:05:06 07:08:10',
+                    piexif.ExifIFD.FocalLength: (50, 1),
+                },
+            })
+        Image.new('RGB', (20, 10), color='red').save(image_path, exif=exif_bytes)
+
+        fast = get_exif_data(str(image_path))
+        with patch('src.core.image_processor._read_jpeg_exif', return_value=None):
+            slow = get_exif_data(str(image_path))
+
+        assert fast
+        assert fast == slow
+        assert {k: type(v) for k, v in fast.items()} == {k: type(v) for k, v in slow.items()}
+
+    def test_get_exif_data_fast_path_skips_pillow(self, temp_image_dir):
+        """JPEGs with an EXIF segment are parsed without Image.open."""
+        image_path = self.create_test_image(temp_image_dir / 'fast.jpg', orientation=6)
+
+        with patch('src.core.image_processor.Image.open', side_effect=AssertionError("opened")):
+            result = get_exif_data(str(image_path))
+
+        assert result == {'Orientation': 6}
+
 
 class TestGetOrientation:
     """Test orientation detection with real and mock image files."""
@@ -166,6 +211,17 @@ class TestGetOrientation:
         result = get_orientation(str(image_path), {})
         assert result == 'landscape'  # Square defaults to landscape
 
+    @pytest.mark.parametrize("progressive", [False, True])
+    def test_get_orientation_jpeg_reads_header_only(self, temp_image_dir, progressive):
+        """JPEG dimensions are read from the SOF marker without opening the image in Pillow."""
+        image_path = temp_image_dir / 'portrait_header.jpg'
+        Image.new('RGB', (120, 300), color='red').save(image_path, progressive=progressive)
+
+        with patch('src.core.image_processor.Image.open', side_effect=AssertionError("opened")):
+            result = get_orientation(str(image_path), {})
+
+        assert result == 'portrait'
+
     def test_get_orientation_invalid_file(self):
         """Test orientation detection with invalid file."""
         result = get_orientation('/nonexistent/path.jpg', {})
@@ -322,6 +378,115 @@ class TestScanDirectories:
         # Should complete without infinite loops or crashes
         assert isinstance(result, dict)
 
+    def test_scan_directories_matches_os_walk(self, temp_scan_dir):
+        """The scandir traversal yields the same slates, paths and slate order as os.walk."""
+        (temp_scan_dir / '.hidden_dir').mkdir()
+        self.create_test_image(temp_scan_dir / '.hidden_dir' / 'skip.jpg')
+        self.create_test_image(temp_scan_dir / 'subdir1' / '._resource.jpg')
+        os.symlink(temp_scan_dir / 'subdir2', temp_scan_dir / 'linked_dir')
+
+        expected = {}
+        for dirpath, dirnames, filenames in os.walk(temp_scan_dir):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            images = [
+                os.path.join(dirpath, f) for f in filenames
+                if not f.startswith('._')
+                and os.path.splitext(f)[1].lower() in ('.jpg', '.jpeg', '.png', '.tiff', '.bmp', '.gif')
+            ]
+            if images:
+                relative_dir = os.path.relpath(dirpath, temp_scan_dir)
+                expected['/' if relative_dir == '.' else relative_dir] = {'images': sorted(images, key=str.lower)}
+
+        result = scan_directories(str(temp_scan_dir))
+
+        assert list(result.items()) == list(expected.items())
+        assert 'linked_dir' not in result
+
+    def test_scan_directories_extension_edge_cases(self, tmp_path):
+        """Extensions match case-insensitively; dot-only names and bare words do not."""
+        for name in ('UPPER.JPG', 'multi.dots.Png', 'jpg', '.jpg', '..gif', 'archive.jpg.zip'):
+            (tmp_path / name).write_bytes(b'x')
+
+        result = scan_directories(str(tmp_path))
+
+        assert sorted(os.path.basename(p) for p in result['/']['images']) == ['UPPER.JPG', 'multi.dots.Png']
+
+    def test_scan_directories_exclude_patterns(self, temp_scan_dir):
+        """Several patterns are matched case-insensitively against files and directories."""
+        self.create_test_image(temp_scan_dir / 'IMG_0001_Draft.JPG')
+        self.create_test_image(temp_scan_dir / 'img_0002.jpg')
+
+        result = scan_directories(str(temp_scan_dir), "*draft*; SUBDIR2 ,image[12].*")
+
+        assert sorted(os.path.basename(p) for p in result['/']['images']) == ['img_0002.jpg', 'root_image.jpg']
+        assert 'subdir1' not in result
+        assert not any(slate.startswith('subdir2') for slate in result)
+
+    def test_scan_directories_resource_forks_skipped_before_stat(self, temp_scan_dir):
+        """._ entries are dropped on their name alone, without a type check."""
+        forks = {'._image1.jpg', '._subdir'}
+        for name in forks:
+            (temp_scan_dir / name).write_bytes(b'x')
+        real_scandir = os.scandir
+        checked = []
+
+        class RecordingEntry:
+            def __init__(self, entry):
+                self._entry = entry
+                self.name = entry.name
+                self.path = entry.path
+
+            def is_dir(self):
+                checked.append(self.name)
+                return self._entry.is_dir()
+
+            def is_symlink(self):
+                return self._entry.is_symlink()
+
+        class RecordingScandir:
+            def __init__(self, path):
+                self._it = real_scandir(path)
+
+            def __enter__(self):
+                return (RecordingEntry(e) for e in self._it)
+
+            def __exit__(self, *exc):
+                self._it.close()
+
+        with patch('src.core.image_processor.os.scandir', RecordingScandir):
+            result = scan_directories(str(temp_scan_dir))
+
+        assert not forks & set(checked)
+        assert len(result['/']['images']) == 1
+
+    def test_scan_directories_sorts_images_case_insensitively(self, tmp_path):
+        """Each slate's images come back in case-insensitive name order."""
+        for name in ('b.jpg', 'C.jpg', 'a.JPG', 'B2.png'):
+            (tmp_path / name).write_bytes(b'x')
+
+        result = scan_directories(str(tmp_path))
+
+        assert [os.path.basename(p) for p in result['/']['images']] == ['a.JPG', 'b.jpg', 'B2.png', 'C.jpg']
+
+    def test_iter_scan_directories_is_lazy(self, temp_scan_dir):
+        """Slates are yielded as directories are read, matching scan_directories."""
+        scanned = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+
+        with patch('src.core.image_processor.os.scandir', side_effect=recording_scandir):
+            slates = iter_scan_directories(str(temp_scan_dir))
+            first_slate, first_images = next(slates)
+            assert first_slate == '/'
+            assert scanned == [str(temp_scan_dir)]
+            rest = list(slates)
+
+        expected = scan_directories(str(temp_scan_dir))
+        assert [(first_slate, first_images), *rest] == [(k, v['images']) for k, v in expected.items()]
+
     @patch('os.path.exists', return_value=False)
     def test_scan_directories_handles_missing_directory(self, mock_exists):
         """Test scanning handles missing directory gracefully."""
@@ -556,3 +721,22 @@ class TestGetImageDate:
         warning_call = mock_logger.warning.call_args[0][0]
         assert 'Invalid date format' in warning_call
         assert 'DateTimeOriginal' in warning_call
+
+    @pytest.mark.parametrize("value", [
+        '2024:02:29 23:59:59',  # Fast path, leap day
+        '2024:1:2 3:4:5',       # Unpadded fields still parse via strptime
+        '2023:02:29 10:00:00',  # Invalid day
+        '2024:13:01 10:00:00',  # Invalid month
+        '    :  :     :  :  ',  # Blank EXIF timestamp
+        '2024:01:01 10:00:0x',
+        '2_24:01:01 10:00:00',
+        '2024:01:01T10:00:00',
+    ])
+    def test_get_image_date_matches_strptime(self, value):
+        """The sliced fast path accepts and rejects exactly what strptime does."""
+        try:
+            expected = datetime.strptime(value, "%Y:%m:%d %H:%M:%S")
+        except ValueError:
+            expected = None
+
+        assert get_image_date({'DateTimeOriginal': value}) == expected
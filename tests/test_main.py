@@ -0,0 +1,262 @@
+"""Tests for the main window's filtering helpers."""
+
+import time
+
+import pytest
+from PySide6.QtCore import QItemSelectionModel, QTimer
+from PySide6.QtWidgets import QMessageBox
+
+from src.main import GalleryGeneratorApp, SignalThrottler
+
+
+def make_slates(*names):
+    """Build a slates dict with one image per slate."""
+    return {name: {"images": [{"path": f"/photos/{name}/1.jpg"}]} for name in names}
+
+
+def set_filter_texts(window, filter_text, exclude_text=""):
+    """Set the filter fields without starting a throttled filter pass."""
+    for line_edit, text in ((window.txt_filter, filter_text), (window.txt_exclude, exclude_text)):
+        line_edit.blockSignals(True)
+        line_edit.setText(text)
+        line_edit.blockSignals(False)
+
+
+@pytest.fixture
+def app_window(tmp_path, monkeypatch, qtbot):
+    """A main window whose config, cache and home directory live under tmp_path."""
+    monkeypatch.setattr("core.config_manager.CONFIG_FILE", str(tmp_path / "config.ini"))
+    monkeypatch.setattr("src.main.HOME_DIR", str(tmp_path))
+    # Delayed UI updates (e.g. hiding the progress bar) would fire after the window
+    # is deleted, during a later test
+    monkeypatch.setattr(QTimer, "singleShot", staticmethod(lambda *args: None))
+
+    window = GalleryGeneratorApp()
+    qtbot.addWidget(window)
+    # Let the startup cache load finish (there is no cache under tmp_path)
+    qtbot.waitUntil(lambda: window.lbl_status.text() == "No cache found. Please scan directory.")
+    return window
+
+
+class TestSignalThrottler:
+    """Test leading and trailing emissions of SignalThrottler."""
+
+    INTERVAL_MS = 100
+
+    @pytest.fixture
+    def throttler(self, qtbot):
+        throttler = SignalThrottler(self.INTERVAL_MS)
+        emissions = []
+        throttler.triggered.connect(lambda: emissions.append(time.monotonic()))
+        yield throttler, emissions
+        throttler.cancel()
+
+    def test_first_call_emits_immediately(self, throttler):
+        """The first call of a burst emits without waiting for the interval."""
+        throttler, emissions = throttler
+
+        throttler.throttle()
+
+        assert len(emissions) == 1
+
+    def test_burst_emits_at_most_once_per_interval(self, throttler, qtbot):
+        """A steady stream of calls emits at most once per interval."""
+        throttler, emissions = throttler
+
+        end = time.monotonic() + 0.5
+        while time.monotonic() < end:
+            throttler.throttle()
+            qtbot.wait(10)
+
+        assert 2 <= len(emissions) <= 6
+        gaps = [later - earlier for earlier, later in zip(emissions, emissions[1:])]
+        assert min(gaps) >= self.INTERVAL_MS / 1000 * 0.9
+
+    def test_one_trailing_emission_after_last_call(self, throttler, qtbot):
+        """Calls during the interval collapse into exactly one trailing emission."""
+        throttler, emissions = throttler
+
+        throttler.throttle()
+        throttler.throttle()
+        throttler.throttle()
+        assert len(emissions) == 1
+
+        qtbot.waitUntil(lambda: len(emissions) == 2, timeout=1000)
+        qtbot.wait(3 * self.INTERVAL_MS)
+
+        assert len(emissions) == 2
+        assert emissions[1] - emissions[0] >= self.INTERVAL_MS / 1000 * 0.9
+
+    def test_single_call_has_no_trailing_emission(self, throttler, qtbot):
+        """A lone call emits once, on the leading edge only."""
+        throttler, emissions = throttler
+
+        throttler.throttle()
+        qtbot.wait(3 * self.INTERVAL_MS)
+
+        assert len(emissions) == 1
+
+    def test_cancel_drops_pending_emission(self, throttler, qtbot):
+        """cancel() drops the trailing emission of the current burst."""
+        throttler, emissions = throttler
+
+        throttler.throttle()
+        throttler.throttle()
+        throttler.cancel()
+        qtbot.wait(3 * self.INTERVAL_MS)
+
+        assert len(emissions) == 1
+
+        # The next call starts a new burst and emits at once
+        throttler.throttle()
+        assert len(emissions) == 2
+
+
+class TestApplyFiltersDebounced:
+    """Test that throttled filter passes skip unchanged filter texts."""
+
+    def test_unchanged_texts_skip_rebuild(self, app_window, monkeypatch):
+        """A pass with the same filter and exclude texts as the list does nothing."""
+        app_window._set_slates(make_slates("shot010", "shot020"))
+        set_filter_texts(app_window, "shot01")
+        app_window.apply_filters()
+
+        calls = []
+        monkeypatch.setattr(app_window, "apply_filters", lambda: calls.append(True))
+
+        app_window.apply_filters_debounced()
+        # Typed and deleted again: the stripped texts match the listed ones
+        set_filter_texts(app_window, "  shot01  ")
+        app_window.apply_filters_debounced()
+
+        assert calls == []
+
+    def test_changed_texts_rebuild(self, app_window, monkeypatch):
+        """A changed filter or exclude text filters again."""
+        app_window._set_slates(make_slates("shot010", "shot020"))
+        app_window.apply_filters()
+
+        calls = []
+        monkeypatch.setattr(app_window, "apply_filters", lambda: calls.append(True))
+
+        set_filter_texts(app_window, "shot02")
+        app_window.apply_filters_debounced()
+        set_filter_texts(app_window, "shot02", "020")
+        app_window.apply_filters_debounced()
+
+        assert calls == [True, True]
+
+
+class TestIncrementalFilter:
+    """Test that narrowing the filter reuses the previous matches correctly."""
+
+    SLATES = make_slates("Shot010", "shot011", "SHOT020", "shot101", "intro", "tshot01x", "cut01")
+
+    def fresh_filter(self, window, text):
+        """Filter with no previous matches to narrow from."""
+        window._set_slates(self.SLATES)
+        set_filter_texts(window, text)
+        window.apply_filters()
+        return list(window._visible_keys)
+
+    def test_narrowing_matches_full_filter(self, app_window):
+        """shot0 -> shot01 -> t01 gives the same slates as filtering each from scratch."""
+        expected = {text: self.fresh_filter(app_window, text) for text in ("shot0", "shot01", "t01")}
+        assert expected["shot01"] == ["Shot010", "shot011", "tshot01x"]
+        assert expected["t01"] == ["Shot010", "cut01", "shot011", "tshot01x"]
+
+        app_window._set_slates(self.SLATES)
+        for text in ("shot0", "shot01", "t01"):
+            set_filter_texts(app_window, text)
+            app_window.apply_filters()
+            assert app_window._visible_keys == expected[text], text
+
+    def test_set_slates_resets_previous_matches(self, app_window):
+        """New slates are filtered in full, not narrowed from the old slates' matches."""
+        app_window._set_slates(self.SLATES)
+        set_filter_texts(app_window, "shot")
+        app_window.apply_filters()
+        assert app_window._last_filter_text == "shot"
+
+        app_window._set_slates(make_slates("shot010", "shot999", "other"))
+
+        assert app_window._last_filter_text == ""
+        assert app_window._last_filter_pairs == []
+        set_filter_texts(app_window, "shot9")
+        app_window.apply_filters()
+        assert app_window._visible_keys == ["shot999"]
+
+
+class TestSelectionRestore:
+    """Test that the slate selection survives a filter change."""
+
+    def select_slates(self, window, *names):
+        selection_model = window.list_slates.selectionModel()
+        for name in names:
+            index = window.slate_model.index(window._listed_keys.index(name))
+            selection_model.select(index, QItemSelectionModel.SelectionFlag.Select)
+
+    def selected_rows(self, window):
+        return sorted(index.row() for index in window.list_slates.selectionModel().selectedIndexes())
+
+    def test_non_adjacent_rows_survive_filter_change(self, app_window):
+        """Separate selected rows stay selected, and rows hidden meanwhile are not reselected."""
+        app_window._set_slates(make_slates("a1", "a2", "a3", "a5", "b4", "b6"))
+        app_window.apply_filters()
+        self.select_slates(app_window, "a1", "a3", "a5", "b4")
+
+        # b4 is filtered out; a1, a3 and a5 stay selected as two separate ranges
+        set_filter_texts(app_window, "a")
+        app_window.apply_filters()
+        assert app_window._listed_keys == ["a1", "a2", "a3", "a5"]
+        assert self.selected_rows(app_window) == [0, 2, 3]
+
+        # Showing b4 again does not bring back its old selection
+        set_filter_texts(app_window, "")
+        app_window.apply_filters()
+        assert app_window._listed_keys == ["a1", "a2", "a3", "a5", "b4", "b6"]
+        assert sorted(app_window._selected_slate_names()) == ["a1", "a3", "a5"]
+        assert self.selected_rows(app_window) == [0, 2, 3]
+
+
+class TestScanReusesRecentSlates:
+    """Test how Scan reuses slates kept in memory from a load or earlier scan."""
+
+    @pytest.fixture
+    def no_prompt(self, monkeypatch):
+        """Fail the test if Scan asks whether to use an outdated cache."""
+        def question(*args, **kwargs):
+            raise AssertionError("Cache Outdated prompt shown")
+        monkeypatch.setattr(QMessageBox, "question", staticmethod(question))
+
+    def test_directory_order_shares_one_entry(self, app_window, tmp_path, monkeypatch, no_prompt):
+        """The same directories selected in another order reuse the entry without a read."""
+        dir_a, dir_b = str(tmp_path / "a"), str(tmp_path / "b")
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        slates = {"shot010": {"images": []}}
+        metadata = app_window.cache_manager.save_composite_cache([dir_a, dir_b], slates)
+        app_window._set_slates(slates, cache_key=(dir_a, dir_b), metadata=metadata)
+
+        reads = []
+        monkeypatch.setattr(app_window.cache_manager, "_read_cache_data", lambda *args: reads.append(args))
+        app_window.selected_slate_dirs = [dir_b, dir_a]
+        app_window.on_scan()
+
+        assert reads == []
+        assert app_window.slates_dict is slates
+        assert list(app_window._recent_slates) == [(dir_a, dir_b)]
+
+    def test_stale_entry_falls_back_to_cache_file(self, app_window, tmp_path, no_prompt):
+        """A stale entry is replaced by a cache file another instance refreshed."""
+        shots = str(tmp_path / "shots")
+        (tmp_path / "shots").mkdir()
+        stale_metadata = {"dir_mtime": 0.0}
+        app_window._set_slates(make_slates("old"), cache_key=(shots,), metadata=stale_metadata)
+        metadata = app_window.cache_manager.save_cache(shots, {"new": {"images": []}})
+
+        app_window.selected_slate_dirs = [shots]
+        app_window.on_scan()
+
+        assert list(app_window.slates_dict) == ["new"]
+        assert app_window._recent_slates[(shots,)][1] == metadata
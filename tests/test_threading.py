@@ -8,7 +8,7 @@ import pytest
 from PIL import Image
 
 from src.core.cache_manager import ImprovedCacheManager
-from src.utils.threading import GenerateGalleryThread, ScanThread
+from src.utils.threading import CacheLoadThread, GenerateGalleryThread, ScanThread
 
 
 def create_real_test_image(path, size=(100, 100), focal_length=None, date_taken=None):
@@ -161,6 +161,37 @@ class TestScanThreadImproved:
         # Results should be identical
         assert second_result == first_result
 
+    def test_cache_load_thread_emits_cached_slates(self, real_test_environment, qtbot, thread_cleanup):
+        """Test that CacheLoadThread delivers the saved cache and its validity."""
+        cache_manager = real_test_environment['cache_manager']
+        images_dir = real_test_environment['images_dir']
+
+        scan = thread_cleanup(ScanThread(images_dir, cache_manager))
+        with qtbot.waitSignal(scan.scan_complete, timeout=5000) as blocker:
+            scan.start()
+        scanned, _ = blocker.args
+
+        loader = thread_cleanup(CacheLoadThread(images_dir, cache_manager))
+        with qtbot.waitSignal(loader.cache_loaded, timeout=5000) as blocker:
+            loader.start()
+
+        slates, metadata, is_valid = blocker.args
+        assert slates == scanned
+        assert metadata == scan.cache_metadata
+        assert metadata["file_count"] == sum(len(slate["images"]) for slate in scanned.values())
+        assert is_valid is True
+
+    def test_cache_load_thread_without_cache(self, real_test_environment, qtbot, thread_cleanup):
+        """Test that CacheLoadThread emits an empty result when nothing is cached."""
+        loader = thread_cleanup(CacheLoadThread(
+            real_test_environment['images_dir'],
+            real_test_environment['cache_manager']
+        ))
+        with qtbot.waitSignal(loader.cache_loaded, timeout=5000) as blocker:
+            loader.start()
+
+        assert blocker.args == [{}, None, False]
+
 
 class TestGenerateGalleryThreadImproved:
     """Test GenerateGalleryThread with real components."""
@@ -315,6 +346,31 @@ class TestGenerateGalleryThreadImproved:
 
         # Thread cleanup handled by fixture
 
+    def test_generate_gallery_with_high_quality_thumbnails(self, gallery_test_environment, qtbot, thread_cleanup):
+        """The high quality opt-in reaches generate_thumbnail."""
+        thread = thread_cleanup(GenerateGalleryThread(
+            selected_slates=['vacation'],
+            slates_dict=gallery_test_environment['slates_dict'],
+            cache_manager=gallery_test_environment['cache_manager'],
+            output_dir=gallery_test_environment['output_dir'],
+            allowed_root_dirs=gallery_test_environment['images_dir'],
+            template_path=gallery_test_environment['template_path'],
+            generate_thumbnails=True,
+            thumbnail_size=600,
+            high_quality_thumbnails=True
+        ))
+
+        with qtbot.waitSignal(thread.gallery_complete, timeout=15000) as blocker:
+            thread.start()
+
+        success, _message = blocker.args
+        assert success is True
+
+        thumb_dir = Path(gallery_test_environment['output_dir']) / 'thumbnails'
+        thumb_files = list(thumb_dir.glob("*.jpg"))
+        assert thumb_files
+        assert all(f.name.endswith('_600x600_hq.jpg') for f in thumb_files)
+
     def test_gallery_thread_error_recovery(self, gallery_test_environment, qtbot, thread_cleanup):
         """Test that gallery thread handles missing template gracefully."""
         # Use non-existent template to trigger error
@@ -158,6 +158,91 @@ class TestGenerateThumbnail:
             with Image.open(thumb_path) as thumb:
                 assert thumb.mode == 'RGB'
 
+    @pytest.mark.parametrize("mode, transparent", [('RGBA', (0, 0, 0, 0)), ('LA', (0, 0))])
+    def test_generate_thumbnail_transparency_flattened_to_white(self, temp_dirs, mode, transparent):
+        """Fully transparent pixels come out white, whatever their stored color."""
+        image_path = temp_dirs['image_dir'] / f'transparent_{mode}.png'
+        Image.new(mode, (200, 200), transparent).save(image_path)
+
+        thumbnails = generate_thumbnail(str(image_path), temp_dirs['thumb_dir'], size=100)
+
+        with Image.open(thumbnails['100x100']) as thumb:
+            assert min(thumb.getpixel((50, 50))) > 245
+
+    def test_generate_thumbnail_large_jpeg_uses_reduced_decode(self, temp_dirs):
+        """Large JPEG sources are decoded at a reduced DCT scale, not full resolution."""
+        image_path = temp_dirs['image_dir'] / 'big.jpg'
+        Image.new('RGB', (4000, 3000), 'green').save(image_path)
+        decoded_sizes = []
+        original_thumbnail = Image.Image.thumbnail
+
+        def recording_thumbnail(img, *args, **kwargs):
+            decoded_sizes.append(img.size)
+            return original_thumbnail(img, *args, **kwargs)
+
+        with patch.object(Image.Image, 'thumbnail', recording_thumbnail):
+            thumbnails = generate_thumbnail(str(image_path), temp_dirs['thumb_dir'], size=400)
+
+        # 1/2 scale is the smallest that keeps both edges >= 2 * 400
+        assert decoded_sizes == [(2000, 1500)]
+        with Image.open(thumbnails['400x400']) as thumb:
+            assert thumb.size == (400, 300)
+
+    def test_generate_thumbnail_recreates_removed_thumb_dir(self, temp_dirs, create_test_image):
+        """The thumbnail directory is created once, but recreated if it disappears."""
+        import shutil
+
+        thumb_dir = temp_dirs['thumb_dir']
+        first = create_test_image('first.jpg')
+        second = create_test_image('second.jpg')
+        generate_thumbnail(first, thumb_dir)
+
+        shutil.rmtree(thumb_dir)
+        thumbnails = generate_thumbnail(second, thumb_dir)
+
+        assert Path(thumbnails['600x600']).exists()
+
+    def test_generate_thumbnail_single_size_skips_copy(self, temp_dirs, create_test_image):
+        """A single requested size resamples the source in place instead of copying it."""
+        image_path = create_test_image()
+
+        with patch.object(Image.Image, 'copy', side_effect=AssertionError("copied")):
+            thumbnails = generate_thumbnail(image_path, temp_dirs['thumb_dir'], size=200)
+
+        with Image.open(thumbnails['200x200']) as thumb:
+            assert thumb.size == (200, 150)
+
+    @pytest.mark.parametrize("high_quality, expected", [
+        (False, Image.Resampling.BICUBIC),
+        (True, Image.Resampling.LANCZOS),
+    ])
+    def test_generate_thumbnail_resample_filter(self, temp_dirs, create_test_image, high_quality, expected):
+        """BICUBIC is the default filter; high_quality opts back into LANCZOS."""
+        image_path = create_test_image()
+        filters = []
+        original_thumbnail = Image.Image.thumbnail
+
+        def recording_thumbnail(img, size, resample=Image.Resampling.BICUBIC, *args, **kwargs):
+            filters.append(resample)
+            return original_thumbnail(img, size, resample, *args, **kwargs)
+
+        with patch.object(Image.Image, 'thumbnail', recording_thumbnail):
+            generate_thumbnail(image_path, temp_dirs['thumb_dir'], size=200, high_quality=high_quality)
+
+        assert filters == [expected]
+
+    def test_generate_thumbnail_high_quality_has_own_file(self, temp_dirs, create_test_image):
+        """High quality thumbnails never reuse the default filter's output, or vice versa."""
+        image_path = create_test_image()
+
+        default = generate_thumbnail(image_path, temp_dirs['thumb_dir'], size=200)
+        high_quality = generate_thumbnail(image_path, temp_dirs['thumb_dir'], size=200, high_quality=True)
+
+        assert default['200x200'] != high_quality['200x200']
+        assert high_quality['200x200'].endswith('_200x200_hq.jpg')
+        assert Path(default['200x200']).exists()
+        assert Path(high_quality['200x200']).exists()
+
     def test_generate_thumbnail_exif_orientation(self, temp_dirs, create_test_image):
         """Test that EXIF orientation is preserved in thumbnails."""
         # Test different orientations
@@ -235,6 +320,34 @@ class TestGenerateThumbnail:
         with Image.open(corrupt_path) as thumb:
             thumb.verify()  # Should not raise exception
 
+    def test_generate_thumbnail_reuse_skips_source_decode(self, temp_dirs, create_test_image):
+        """A current thumbnail is returned without opening the source image."""
+        image_path = create_test_image()
+        thumb_dir = temp_dirs['thumb_dir']
+        thumbnails = generate_thumbnail(image_path, thumb_dir)
+
+        with patch('src.core.image_processor.Image.open', side_effect=AssertionError("decoded")):
+            assert generate_thumbnail(image_path, thumb_dir) == thumbnails
+
+    def test_generate_thumbnail_stale_existing(self, temp_dirs, create_test_image):
+        """Thumbnails older than their source image are regenerated."""
+        import os
+
+        image_path = create_test_image(color='blue')
+        thumb_dir = temp_dirs['thumb_dir']
+        thumb_path = generate_thumbnail(image_path, thumb_dir)['600x600']
+
+        # Source edited after the thumbnail was made
+        Image.new('RGB', (800, 600), color='red').save(image_path)
+        stat = os.stat(thumb_path)
+        os.utime(thumb_path, ns=(stat.st_atime_ns, os.stat(image_path).st_mtime_ns - 10**9))
+
+        generate_thumbnail(image_path, thumb_dir)
+
+        with Image.open(thumb_path) as thumb:
+            red, _green, blue = thumb.convert('RGB').getpixel((10, 10))
+            assert red > 200 and blue < 50
+
     def test_generate_thumbnail_invalid_image(self, temp_dirs):
         """Test handling of invalid image files."""
         # Create invalid image file
@@ -253,6 +366,20 @@ class TestGenerateThumbnail:
             mock_logger.error.assert_called()
             assert 'Error generating thumbnails' in str(mock_logger.error.call_args)
 
+    @pytest.mark.parametrize("content", [b'', b'\xff\xd8', b'<html>not an image</html>'])
+    def test_generate_thumbnail_rejects_bad_signature_without_pillow(self, temp_dirs, content):
+        """Empty, truncated or mislabelled files are rejected by their magic bytes."""
+        image_path = temp_dirs['image_dir'] / 'bad.jpg'
+        image_path.write_bytes(content)
+
+        with patch('src.core.image_processor.Image.open') as mock_open, \
+                patch('src.core.image_processor.logger') as mock_logger:
+            thumbnails = generate_thumbnail(str(image_path), temp_dirs['thumb_dir'])
+
+        assert thumbnails == {}
+        mock_open.assert_not_called()
+        assert 'Not a recognised image file' in str(mock_logger.error.call_args)
+
     def test_generate_thumbnail_nonexistent_image(self, temp_dirs):
         """Test handling of non-existent image files."""
         nonexistent_path = str(temp_dirs['image_dir'] / 'nonexistent.jpg')
@@ -291,6 +418,16 @@ class TestGenerateThumbnail:
         for size_str in thumbnails1:
             assert thumbnails1[size_str] != thumbnails2[size_str]
 
+    def test_generate_thumbnail_filename_is_stable(self, temp_dirs, create_test_image):
+        """Thumbnail names keep the existing md5-based scheme so old thumbnails stay valid."""
+        import hashlib
+
+        image_path = create_test_image()
+        thumbnails = generate_thumbnail(image_path, temp_dirs['thumb_dir'])
+
+        expected_hash = hashlib.md5(image_path.encode()).hexdigest()[:8]
+        assert Path(thumbnails['600x600']).name == f"test_{expected_hash}_600x600.jpg"
+
     def test_generate_thumbnail_large_image(self, temp_dirs):
         """Test thumbnail generation for large images."""
         # Create a large image